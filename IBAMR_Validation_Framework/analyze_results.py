@@ -12,13 +12,16 @@ Usage:
 Options:
     --results-dir PATH    Path to results directory (default: ./results)
     --report-output PATH  Path to report output (default: ./Compatibility_Report.md)
+    --jobs N              Number of worker processes for per-test analysis
+                          (default: cpu_count)
 """
 
 import sys
 import os
 import argparse
-import json
 from pathlib import Path
+from typing import Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
 
 # Add validation framework to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -26,6 +29,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from validation_framework.analysis import *
 from validation_framework.plotting import *
 from validation_framework.reporting import generate_compatibility_report
+from validation_framework.json_io import read_json, write_json
 
 
 def analyze_test_results(test_dir: Path):
@@ -79,22 +83,17 @@ def analyze_test_results(test_dir: Path):
         if log_file.exists():
             metrics['has_log'] = True
 
-            # Parse log for useful info
-            with open(log_file, 'r') as f:
-                log_content = f.read()
-
-                # Example: extract timesteps, convergence info, etc.
-                # This depends on IBAMR output format
+            # Example: extract timesteps, convergence info, etc.
+            # This depends on IBAMR output format
 
         # Save metrics
         metrics_file = test_dir / 'metrics.json'
-        with open(metrics_file, 'w') as f:
-            json.dump(metrics, f, indent=2)
+        write_json(metrics_file, metrics)
 
         print(f"  ✓ Metrics saved to {metrics_file}")
 
         # Generate summary for this test
-        generate_test_summary(test_dir)
+        generate_test_summary(test_dir, metrics=metrics)
 
     except Exception as e:
         print(f"  ✗ Error analyzing {test_dir.name}: {str(e)}")
@@ -104,58 +103,58 @@ def analyze_test_results(test_dir: Path):
         }
 
         metrics_file = test_dir / 'metrics.json'
-        with open(metrics_file, 'w') as f:
-            json.dump(metrics, f, indent=2)
+        write_json(metrics_file, metrics)
+
 
+def generate_test_summary(test_dir: Path, metrics: Optional[Dict] = None):
+    """
+    Generate individual test summary.
 
-def generate_test_summary(test_dir: Path):
-    """Generate individual test summary"""
+    Parameters:
+    -----------
+    test_dir : Path
+        Path to test results directory
+    metrics : dict, optional
+        Already computed metrics; loaded from metrics.json if not given
+    """
     summary_file = test_dir / 'summary.md'
 
-    lines = [
-        f"# {test_dir.name} - Test Summary",
-        "",
-        f"**Test Directory:** `{test_dir}`",
-        "",
-        "## Test Information",
-        ""
+    sections = [
+        f"# {test_dir.name} - Test Summary\n"
+        f"\n"
+        f"**Test Directory:** `{test_dir}`\n"
+        f"\n"
+        f"## Test Information\n"
+        f"\n"
     ]
 
     # Load metrics if available
     metrics_file = test_dir / 'metrics.json'
-    if metrics_file.exists():
-        with open(metrics_file, 'r') as f:
-            metrics = json.load(f)
+    if metrics is None and metrics_file.exists():
+        metrics = read_json(metrics_file)
 
-        lines.append("### Computed Metrics")
-        lines.append("")
-        for key, value in metrics.items():
-            lines.append(f"- **{key}:** {value}")
-        lines.append("")
+    if metrics is not None:
+        metric_lines = ''.join(f"- **{key}:** {value}\n" for key, value in metrics.items())
+        sections.append(f"### Computed Metrics\n\n{metric_lines}\n")
 
     # Link to plots
     plots_dir = test_dir / 'plots'
     if plots_dir.exists():
-        plot_files = list(plots_dir.glob('*.png'))
-        if plot_files:
-            lines.append("## Visualizations")
-            lines.append("")
-            for plot_file in sorted(plot_files):
-                rel_path = os.path.relpath(plot_file, test_dir)
-                lines.append(f"![{plot_file.stem}]({rel_path})")
-                lines.append("")
+        with os.scandir(plots_dir) as entries:
+            png_names = sorted(e.name for e in entries if e.name.endswith('.png'))
+        if png_names:
+            plots_rel = os.path.relpath(plots_dir, test_dir)
+            plot_lines = ''.join(f"![{name[:-4]}]({os.path.join(plots_rel, name)})\n\n"
+                                 for name in png_names)
+            sections.append(f"## Visualizations\n\n{plot_lines}")
 
     # Raw output files
     raw_dir = test_dir / 'raw'
     if raw_dir.exists():
-        lines.append("## Raw Output Files")
-        lines.append("")
-        for item in sorted(raw_dir.iterdir()):
-            lines.append(f"- `{item.name}`")
-        lines.append("")
+        raw_lines = ''.join(f"- `{item.name}`\n" for item in sorted(raw_dir.iterdir()))
+        sections.append(f"## Raw Output Files\n\n{raw_lines}\n")
 
-    with open(summary_file, 'w') as f:
-        f.write('\n'.join(lines))
+    summary_file.write_text(''.join(sections))
 
 
 def main():
@@ -168,6 +167,8 @@ def main():
                        help='Path to results directory')
     parser.add_argument('--report-output', type=str, default='./Compatibility_Report.md',
                        help='Path to report output file')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                       help='Number of worker processes for per-test analysis')
 
     args = parser.parse_args()
 
@@ -186,14 +187,16 @@ def main():
     print()
 
     # Find all test result directories
-    test_dirs = sorted([d for d in results_dir.iterdir()
-                       if d.is_dir() and d.name.startswith('Test')])
+    with os.scandir(results_dir) as entries:
+        test_dirs = sorted(Path(e.path) for e in entries
+                           if e.name.startswith('Test') and e.is_dir(follow_symlinks=False))
 
     print(f"Found {len(test_dirs)} test result directories")
 
-    # Analyze each test
-    for test_dir in test_dirs:
-        analyze_test_results(test_dir)
+    # Analyze each test (tests are independent, so run them in parallel)
+    if test_dirs:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            list(executor.map(analyze_test_results, test_dirs))
 
     print("\n" + "="*70)
     print("Generating compatibility report...")
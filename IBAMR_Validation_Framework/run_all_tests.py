@@ -14,6 +14,8 @@ Options:
     --results-dir PATH  Path to results directory (default: ./results)
     --mpi-np N          Number of MPI processes (default: 4)
     --timeout SEC       Timeout per test in seconds (default: 3600)
+    --max-parallel N    Number of tests to run concurrently
+                        (default: cpu_count // mpi-np)
     --tests TEST1,TEST2 Run only specific tests (default: all)
     --clean             Clean results directory before running
     --dry-run           Show what would be run without executing
@@ -26,12 +28,44 @@ import os
 import sys
 import subprocess
 import argparse
-import json
 import shutil
 from pathlib import Path
 from datetime import datetime
 import re
 import glob
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Add validation framework to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from validation_framework.json_io import read_json, write_json
+
+def _load_durations(path):
+    """Load last measured test durations, keyed by test name"""
+    try:
+        return read_json(path)
+    except (OSError, ValueError):
+        return {}
+
+def _save_durations(path, durations, results):
+    """Record the measured duration of each completed test"""
+    for result in results:
+        if 'duration' in result:
+            durations[result['test']] = result['duration']
+    try:
+        write_json(path, durations)
+    except OSError:
+        pass
+
+def _link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a copy across filesystems"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -48,12 +82,41 @@ class Colors:
 class TestDiscovery:
     """Discovers all IBAMR tests in the suite"""
 
+    _DISCOVERY_CACHE = '.test_discovery_cache.json'
+
+    # Based on CMakeLists.txt mapping
+    _EXECUTABLE_MAP = {
+        'Test01_SmokeTest': 'test01_smoke',
+        'Test02_Diffusion_Analytic': 'test02_diffusion',
+        'Test03_Advection_Analytic': 'test03_advection',
+        'Test04_MMS': 'test04_mms',
+        'Test05_Discontinuous': 'test05_discontinuous',
+        'Test06_MassConservation': 'test06_mass_conservation',
+        'Test07_BCs': 'test07_bcs',
+        'Test08_SphereSource': 'test08_sphere_source',
+        'Test09_HighSc': 'test09_high_sc',
+        'Test10_MovingIB': 'test10_moving_ib',
+        'Test11_AMR': 'test11_amr',
+        'Test12_TimeStep': 'test12_timestep',
+        'Test13_LongRun': 'test13_long_run',
+        'Test14_Benchmarks': 'test14_benchmarks',
+        'Test15_RotatingCylinder': 'test15_rotating_cylinder',
+        'Test16_3DSphere': 'test16_3d_sphere',
+        'Test17_PitchPlunge': 'test17_pitch_plunge',
+    }
+
     def __init__(self, suite_dir):
         self.suite_dir = Path(suite_dir)
         self.tests = []
 
     def discover_tests(self):
         """Find all Test* directories"""
+        cache_key = self._discovery_cache_key()
+        cached = self._load_discovery_cache(cache_key)
+        if cached is not None:
+            self.tests = cached
+            return self.tests
+
         test_dirs = sorted(self.suite_dir.glob("Test*"))
 
         for test_dir in test_dirs:
@@ -82,41 +145,71 @@ class TestDiscovery:
 
             self.tests.append(test_info)
 
+        self._save_discovery_cache(cache_key)
         return self.tests
 
+    def _discovery_cache_key(self):
+        """Modification times that invalidate the discovery cache"""
+        # Adding or removing main.cpp/input files updates the mtime of the
+        # containing Test* directory, so file contents need not be checked.
+        # The suite directory's own mtime is not used because writing the
+        # cache file changes it.
+        key = {'suite_dir': str(self.suite_dir)}
+        with os.scandir(self.suite_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('Test') and entry.is_dir():
+                    key[entry.name] = entry.stat().st_mtime_ns
+        return key
+
+    def _load_discovery_cache(self, cache_key):
+        """Return cached tests if the cache key still matches"""
+        cache_file = self.suite_dir / self._DISCOVERY_CACHE
+        try:
+            cache = read_json(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        if cache.get('key') != cache_key:
+            return None
+        return cache.get('tests')
+
+    def _save_discovery_cache(self, cache_key):
+        """Store discovered tests alongside their cache key"""
+        try:
+            write_json(self.suite_dir / self._DISCOVERY_CACHE,
+                        {'key': cache_key, 'tests': self.tests})
+        except OSError:
+            pass
+
     def _get_executable_name(self, test_name):
         """Map test directory name to executable name"""
-        # Based on CMakeLists.txt mapping
-        mapping = {
-            'Test01_SmokeTest': 'test01_smoke',
-            'Test02_Diffusion_Analytic': 'test02_diffusion',
-            'Test03_Advection_Analytic': 'test03_advection',
-            'Test04_MMS': 'test04_mms',
-            'Test05_Discontinuous': 'test05_discontinuous',
-            'Test06_MassConservation': 'test06_mass_conservation',
-            'Test07_BCs': 'test07_bcs',
-            'Test08_SphereSource': 'test08_sphere_source',
-            'Test09_HighSc': 'test09_high_sc',
-            'Test10_MovingIB': 'test10_moving_ib',
-            'Test11_AMR': 'test11_amr',
-            'Test12_TimeStep': 'test12_timestep',
-            'Test13_LongRun': 'test13_long_run',
-            'Test14_Benchmarks': 'test14_benchmarks',
-            'Test15_RotatingCylinder': 'test15_rotating_cylinder',
-            'Test16_3DSphere': 'test16_3d_sphere',
-            'Test17_PitchPlunge': 'test17_pitch_plunge',
-        }
-        return mapping.get(test_name, test_name.lower())
+        return self._EXECUTABLE_MAP.get(test_name, test_name.lower())
 
 class TestRunner:
     """Runs individual tests and captures output"""
 
+    # Seconds between liveness/disk checks while a test is running
+    _POLL_INTERVAL = 30
+    # Seconds to wait after SIGTERM before sending SIGKILL
+    _KILL_GRACE_PERIOD = 10
+    # Stop a test if free space where it writes output drops below this
+    _MIN_FREE_BYTES = 1 << 30
+
+    # Input file name patterns in order of preference
+    _INPUT_PRIORITY = [
+        re.compile(r'input2d'),
+        re.compile(r'input3d'),
+        re.compile(r'input'),
+    ]
+
     def __init__(self, build_dir, results_dir, mpi_np=4, timeout=3600):
         self.build_dir = Path(build_dir)
         self.results_dir = Path(results_dir)
         self.mpi_np = mpi_np
         self.timeout = timeout
         self.results = []
+        self._results_lock = threading.Lock()
+        self._cleanup_threads = []
 
     def run_test(self, test_info, dry_run=False):
         """Run a single test"""
@@ -150,7 +243,7 @@ class TestRunner:
 
         # Clean and create directories
         if test_results_dir.exists():
-            shutil.rmtree(test_results_dir)
+            self._discard_old_results(test_results_dir)
         raw_dir.mkdir(parents=True, exist_ok=True)
         plots_dir.mkdir(parents=True, exist_ok=True)
 
@@ -187,13 +280,13 @@ class TestRunner:
         try:
             with open(log_file, 'w') as log_f, open(error_file, 'w') as err_f:
                 # Run from test directory
-                result = subprocess.run(
+                proc = subprocess.Popen(
                     cmd,
                     cwd=str(test_dir),
                     stdout=log_f,
-                    stderr=err_f,
-                    timeout=self.timeout
+                    stderr=err_f
                 )
+                returncode = self._wait_for_process(proc, cmd, test_dir)
 
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
@@ -202,18 +295,18 @@ class TestRunner:
             self._collect_output_files(test_dir, raw_dir)
 
             # Determine status
-            if result.returncode == 0:
+            if returncode == 0:
                 status = 'PASSED'
                 print(f"\n{Colors.OKGREEN}✓ Test PASSED (duration: {duration:.1f}s){Colors.ENDC}")
             else:
                 status = 'FAILED'
-                print(f"\n{Colors.FAIL}✗ Test FAILED (return code: {result.returncode}){Colors.ENDC}")
+                print(f"\n{Colors.FAIL}✗ Test FAILED (return code: {returncode}){Colors.ENDC}")
 
             test_result = {
                 'test': test_name,
                 'status': status,
                 'duration': duration,
-                'return_code': result.returncode,
+                'return_code': returncode,
                 'start_time': start_time.isoformat(),
                 'end_time': end_time.isoformat(),
                 'log_file': str(log_file),
@@ -255,12 +348,61 @@ class TestRunner:
 
         # Save test result
         result_json = test_results_dir / 'test_result.json'
-        with open(result_json, 'w') as f:
-            json.dump(test_result, f, indent=2)
+        write_json(result_json, test_result)
 
-        self.results.append(test_result)
+        with self._results_lock:
+            self.results.append(test_result)
         return test_result
 
+    def _wait_for_process(self, proc, cmd, test_dir):
+        """Wait for a running test, enforcing the timeout and disk space"""
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._terminate_process(proc)
+                raise subprocess.TimeoutExpired(cmd, self.timeout)
+
+            try:
+                return proc.wait(timeout=min(self._POLL_INTERVAL, remaining))
+            except subprocess.TimeoutExpired:
+                pass
+
+            if shutil.disk_usage(test_dir).free < self._MIN_FREE_BYTES:
+                self._terminate_process(proc)
+                raise RuntimeError('Insufficient disk space, test terminated')
+
+    def _terminate_process(self, proc):
+        """Terminate a test process, killing it if it does not exit"""
+        proc.terminate()
+        try:
+            proc.wait(timeout=self._KILL_GRACE_PERIOD)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def _discard_old_results(self, test_results_dir):
+        """Move stale results aside and delete them in the background"""
+        # Renaming is a single metadata operation, so the test can start
+        # right away while the old tree is removed concurrently. The dot
+        # prefix keeps it from being picked up as a Test* results directory.
+        old_dir = test_results_dir.with_name(
+            f".{test_results_dir.name}.old.{time.time_ns()}")
+        test_results_dir.rename(old_dir)
+
+        thread = threading.Thread(target=shutil.rmtree, args=(old_dir,),
+                                  kwargs={'ignore_errors': True})
+        thread.start()
+        with self._results_lock:
+            self._cleanup_threads.append(thread)
+
+    def wait_for_cleanup(self):
+        """Wait for background deletion of stale results to finish"""
+        for thread in self._cleanup_threads:
+            thread.join()
+        self._cleanup_threads.clear()
+
     def _select_input_file(self, test_info):
         """Select appropriate input file (prefer 2d)"""
         input_files = test_info['input_files']
@@ -268,31 +410,40 @@ class TestRunner:
         if not input_files:
             return None
 
-        # Prefer input2d
-        for f in input_files:
-            if 'input2d' in f:
-                return f
+        # Prefer input2d, then input3d, then any other input*
+        names = [os.path.basename(f) for f in input_files]
+        for pattern in self._INPUT_PRIORITY:
+            for f, name in zip(input_files, names):
+                if pattern.search(name):
+                    return f
 
         # Otherwise use first available
         return input_files[0]
 
     def _collect_output_files(self, test_dir, raw_dir):
         """Collect all output files generated by the test"""
-        patterns = ['*.visit', '*.h5', '*.xmf', '*.dat', '*.csv', '*.vtk', 'viz*', 'dumps*']
-
-        for pattern in patterns:
-            for file in test_dir.glob(pattern):
-                if file.is_file():
-                    dest = raw_dir / file.name
-                    shutil.copy2(file, dest)
-
-        # Also collect any directories like viz_IB2d, dumps
-        for item in test_dir.iterdir():
-            if item.is_dir() and (item.name.startswith('viz') or item.name.startswith('dump')):
-                dest_dir = raw_dir / item.name
-                if dest_dir.exists():
-                    shutil.rmtree(dest_dir)
-                shutil.copytree(item, dest_dir)
+        suffixes = {'.visit', '.h5', '.xmf', '.dat', '.csv', '.vtk'}
+        file_prefixes = ('viz', 'dumps')
+        dir_prefixes = ('viz', 'dump')
+
+        # Single directory read; DirEntry caches the file type
+        with os.scandir(test_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if (os.path.splitext(entry.name)[1] in suffixes
+                            or entry.name.startswith(file_prefixes)):
+                        dest = raw_dir / entry.name
+                        if dest.exists():
+                            dest.unlink()
+                        _link_or_copy(entry.path, dest)
+
+                # Also collect any directories like viz_IB2d, dumps
+                elif entry.is_dir() and entry.name.startswith(dir_prefixes):
+                    dest_dir = raw_dir / entry.name
+                    if dest_dir.exists():
+                        shutil.rmtree(dest_dir)
+                    shutil.copytree(entry.path, dest_dir,
+                                    copy_function=_link_or_copy)
 
 def main():
     """Main entry point"""
@@ -309,6 +460,9 @@ def main():
                         help='Number of MPI processes (default: 4)')
     parser.add_argument('--timeout', type=int, default=3600,
                         help='Timeout per test in seconds (default: 3600)')
+    parser.add_argument('--max-parallel', type=int, default=None,
+                        help='Number of tests to run concurrently '
+                             '(default: cpu_count // mpi-np)')
     parser.add_argument('--tests', type=str,
                         help='Comma-separated list of tests to run (default: all)')
     parser.add_argument('--clean', action='store_true',
@@ -318,6 +472,10 @@ def main():
 
     args = parser.parse_args()
 
+    # Keep total MPI ranks (workers x mpi_np) within the host core count
+    if args.max_parallel is None:
+        args.max_parallel = max(1, (os.cpu_count() or 1) // args.mpi_np)
+
     # Print header
     print(f"\n{Colors.BOLD}{Colors.HEADER}")
     print("="*70)
@@ -328,6 +486,7 @@ def main():
     print(f"Results directory: {args.results_dir}")
     print(f"MPI processes:     {args.mpi_np}")
     print(f"Timeout:           {args.timeout}s")
+    print(f"Max parallel:      {args.max_parallel}")
     print(f"Dry run:           {args.dry_run}")
     print()
 
@@ -349,6 +508,14 @@ def main():
         all_tests = [t for t in all_tests if t['name'] in test_names]
         print(f"\n{Colors.WARNING}Filtered to {len(all_tests)} tests{Colors.ENDC}")
 
+    # Longest-first (LPT) ordering shortens the makespan of a parallel run.
+    # Tests without a recorded duration go first since they may be long;
+    # ties fall back to the test number, later tests tending to be longer.
+    durations_file = suite_dir / '.test_durations.json'
+    durations = _load_durations(durations_file)
+    all_tests.sort(key=lambda t: (durations.get(t['name'], float('inf')), t['name']),
+                   reverse=True)
+
     # Clean results directory if requested
     results_dir = Path(args.results_dir)
     if args.clean and results_dir.exists() and not args.dry_run:
@@ -362,12 +529,22 @@ def main():
 
     print(f"\n{Colors.BOLD}Starting test execution...{Colors.ENDC}\n")
 
-    for i, test in enumerate(all_tests, 1):
-        print(f"\n{Colors.BOLD}[{i}/{len(all_tests)}]{Colors.ENDC}")
-        runner.run_test(test, dry_run=args.dry_run)
+    with ThreadPoolExecutor(max_workers=args.max_parallel) as executor:
+        futures = {executor.submit(runner.run_test, test, args.dry_run): test
+                   for test in all_tests}
+
+        for i, future in enumerate(as_completed(futures), 1):
+            test = futures[future]
+            result = future.result()
+            print(f"\n{Colors.BOLD}[{i}/{len(all_tests)}] "
+                  f"{test['name']}: {result['status']}{Colors.ENDC}")
+
+    runner.wait_for_cleanup()
 
     # Save summary
     if not args.dry_run:
+        _save_durations(durations_file, durations, runner.results)
+
         summary_file = results_dir / 'test_summary.json'
         summary = {
             'timestamp': datetime.now().isoformat(),
@@ -380,8 +557,7 @@ def main():
             }
         }
 
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2)
+        write_json(summary_file, summary, pretty=True)
 
         # Print final summary
         print(f"\n{Colors.BOLD}{Colors.HEADER}")
@@ -0,0 +1,126 @@
+"""
+convergence against the original NumPy formulations.
+"""
+
+import numpy as np
+import pytest
+
+from validation_framework.analysis import convergence
+from validation_framework.analysis.convergence import (
+    compute_eoc_table, compute_eoc_table_soa, estimate_discretization_error)
+
+
+def _baseline_eoc_table(errors, resolutions):
+    """EOC rows as the original loop over levels"""
+    table = []
+    for i in range(len(errors)):
+        entry = {'level': i, 'resolution': resolutions[i], 'error': errors[i]}
+        if i > 0:
+            h_ratio = resolutions[i] / resolutions[i-1]
+            e_ratio = errors[i] / errors[i-1]
+            entry['eoc'] = np.log(e_ratio) / np.log(h_ratio)
+            entry['reduction_factor'] = e_ratio
+        else:
+            entry['eoc'] = None
+            entry['reduction_factor'] = None
+        table.append(entry)
+    return table
+
+
+CASES = {
+    'second_order': ([1e-2, 2.5e-3, 6.25e-4, 1.5625e-4], [32, 64, 128, 256]),
+    'irregular': ([3.1e-2, 1.2e-2, 2.9e-3, 8.0e-4, 1.7e-4], [0.1, 0.05, 0.03, 0.01, 0.005]),
+    'integer': (np.array([64, 16, 4, 1]), np.array([8, 16, 32, 64])),
+    'nan': ([1e-2, np.nan, 6.25e-4], [32, 64, 128]),
+    'single_level': ([1e-3], [64]),
+}
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_eoc_table_soa_matches_baseline(case):
+    errors, resolutions = CASES[case]
+    expected = _baseline_eoc_table(errors, resolutions)
+    columns = compute_eoc_table_soa(errors, resolutions)
+
+    assert all(len(values) == len(expected) for values in columns.values())
+    np.testing.assert_array_equal(columns['level'], [row['level'] for row in expected])
+    np.testing.assert_allclose(columns['resolution'], [row['resolution'] for row in expected])
+    np.testing.assert_allclose(columns['error'], [row['error'] for row in expected])
+
+    # The coarsest level has no EOC; columns pad it with NaN
+    for key in ('eoc', 'reduction_factor'):
+        assert np.isnan(columns[key][0])
+        np.testing.assert_allclose(columns[key][1:],
+                                   [row[key] for row in expected[1:]], rtol=1e-12)
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_eoc_table_rows_match_baseline(case):
+    errors, resolutions = CASES[case]
+    expected = _baseline_eoc_table(errors, resolutions)
+    table = compute_eoc_table(errors, resolutions)
+
+    assert len(table) == len(expected)
+    for row, expected_row in zip(table, expected):
+        assert row.keys() == expected_row.keys()
+        for key, value in expected_row.items():
+            if value is None:
+                assert row[key] is None, key
+            else:
+                np.testing.assert_allclose(row[key], value, rtol=1e-12, err_msg=key)
+
+
+
+# Inputs the scalar path hands back to NumPy, and a table longer than it takes
+FALLBACK_CASES = {
+    'zero_error': ([1e-2, 0.0, 1e-4], [32, 64, 128]),
+    'negative_error': ([1e-2, -1e-3], [32, 64]),
+    'repeated_resolution': ([1e-2, 5e-3], [64, 64]),
+    'many_levels': (list(np.geomspace(1e-1, 1e-9, convergence._SCALAR_EOC_MAX_LEVELS + 4)),
+                    list(2.0 ** -np.arange(convergence._SCALAR_EOC_MAX_LEVELS + 4))),
+}
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('case', {**CASES, **FALLBACK_CASES})
+def test_eoc_table_scalar_path_matches_soa(case):
+    errors, resolutions = {**CASES, **FALLBACK_CASES}[case]
+    columns = compute_eoc_table_soa(errors, resolutions)
+    table = compute_eoc_table(errors, resolutions)
+
+    for key, values in columns.items():
+        column = [row[key] for row in table]
+        if key in ('eoc', 'reduction_factor'):
+            assert column[0] is None
+            column, values = column[1:], values[1:]
+        assert all(isinstance(value, (int, float)) for value in column), key
+        np.testing.assert_allclose(np.array(column, dtype=float), values,
+                                   rtol=1e-12, err_msg=key)
+
+def _baseline_discretization_error(f_fine, f_medium, f_coarse, r):
+    """GCI estimate as the original NumPy scalar formulas"""
+    epsilon_32 = f_coarse - f_medium
+    epsilon_21 = f_medium - f_fine
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = np.log(abs(epsilon_32 / epsilon_21)) / np.log(np.float64(r))
+        denominator = np.float64(r)**p - 1
+        GCI_fine = 1.25 * abs(epsilon_21) / denominator
+        extrapolated = f_fine + epsilon_21 / denominator
+    return {'apparent_order': p, 'GCI_fine': GCI_fine, 'extrapolated_value': extrapolated}
+
+
+@pytest.mark.parametrize('values,r', [
+    ((1.0, 1.1, 1.3), 2.0),
+    ((1.0, 1.01, 1.05), 1.5),
+    # Equal successive differences: apparent order 0, so r**p == 1
+    ((1.0, 2.0, 3.0), 2.0),
+    # No refinement: log(r) == 0 and r**p == 1
+    ((1.0, 2.0, 4.0), 1.0),
+    ((1.0, 2.0, 3.0), 1.0),
+    ((1.0, 2.0, 1.5), 1.0),
+])
+def test_discretization_error_matches_baseline(values, r):
+    result = estimate_discretization_error(*values, refinement_ratio=r)
+    expected = _baseline_discretization_error(*values, r)
+    for key, value in expected.items():
+        np.testing.assert_allclose(result[key], value, rtol=1e-12, err_msg=key)
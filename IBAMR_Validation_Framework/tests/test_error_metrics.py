@@ -0,0 +1,83 @@
+"""
+Numba kernels in error_metrics against the plain NumPy path.
+"""
+
+import numpy as np
+import pytest
+
+from validation_framework.analysis import error_metrics as em
+
+requires_numba = pytest.mark.skipif(not em._HAVE_NUMBA, reason="numba not installed")
+
+# Large enough to take the Numba path
+SHAPE = (400, 300)
+assert SHAPE[0] * SHAPE[1] >= em._NUMBA_MIN_SIZE
+
+
+def _numpy_path(monkeypatch, fn, *args, **kwargs):
+    """Call fn with the Numba kernels disabled"""
+    with monkeypatch.context() as m:
+        m.setattr(em, '_HAVE_NUMBA', False)
+        return fn(*args, **kwargs)
+
+
+@pytest.fixture
+def fields():
+    rng = np.random.default_rng(0)
+    return rng.random(SHAPE), rng.random(SHAPE)
+
+
+@requires_numba
+@pytest.mark.parametrize('spacing', [{}, {'dx': 0.1, 'dy': 0.2},
+                                     {'dx': np.linspace(0.1, 0.2, SHAPE[0]), 'dy': 0.2}])
+def test_all_errors_matches_numpy(monkeypatch, fields, spacing):
+    computed, exact = fields
+    expected = _numpy_path(monkeypatch, em.compute_all_errors, computed, exact, **spacing)
+    result = em.compute_all_errors(computed, exact, **spacing)
+    for key, value in expected.items():
+        assert result[key] == pytest.approx(value, rel=1e-10), key
+
+
+@requires_numba
+@pytest.mark.parametrize('which', ['computed', 'exact'])
+@pytest.mark.parametrize('spacing', [{}, {'dx': np.linspace(0.1, 0.2, SHAPE[0])}])
+def test_all_errors_nan_propagates(monkeypatch, fields, which, spacing):
+    computed, exact = (a.copy() for a in fields)
+    (computed if which == 'computed' else exact)[5, 7] = np.nan
+
+    expected = _numpy_path(monkeypatch, em.compute_all_errors, computed, exact, **spacing)
+    result = em.compute_all_errors(computed, exact, **spacing)
+    for key, value in expected.items():
+        assert np.isnan(value), key
+        assert np.isnan(result[key]), key
+
+
+@requires_numba
+def test_linf_matches_numpy(monkeypatch, fields):
+    computed, exact = fields
+    expected = _numpy_path(monkeypatch, em.compute_linf_error, computed, exact)
+    assert em.compute_linf_error(computed, exact) == pytest.approx(expected, rel=1e-12)
+
+
+@requires_numba
+@pytest.mark.parametrize('which', ['computed', 'exact'])
+def test_linf_nan_propagates(monkeypatch, fields, which):
+    computed, exact = (a.copy() for a in fields)
+    (computed if which == 'computed' else exact)[5, 7] = np.nan
+
+    assert np.isnan(_numpy_path(monkeypatch, em.compute_linf_error, computed, exact))
+    assert np.isnan(em.compute_linf_error(computed, exact))
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.uint32, np.int8])
+def test_linf_integer_exact(monkeypatch, dtype):
+    # -min wraps past max for a positive unsigned minimum and for the most
+    # negative signed value
+    info = np.iinfo(dtype)
+    exact = np.array([[info.min or 1, 1], [2, info.max // 2]], dtype=dtype)
+    computed = exact.astype(np.float64) + 0.5
+
+    # Original formula: max|computed - exact| / max|exact|, in float64
+    expected = 0.5 / np.max(np.abs(exact.astype(np.float64)))
+    result = _numpy_path(monkeypatch, em.compute_linf_error, computed, exact)
+    assert result == pytest.approx(expected, rel=1e-12)
@@ -0,0 +1,190 @@
+"""
+field_analysis against the original NumPy formulations.
+"""
+
+import h5py
+import numpy as np
+import pytest
+
+from validation_framework.analysis import field_analysis as fa
+from validation_framework.analysis.field_analysis import FieldAnalyzer
+
+requires_numba = pytest.mark.skipif(not fa._HAVE_NUMBA, reason="numba not installed")
+
+# Large enough to take the Numba path
+LARGE_SHAPE = (400, 300)
+assert LARGE_SHAPE[0] * LARGE_SHAPE[1] >= fa._NUMBA_MIN_SIZE
+
+
+def _write_h5(path, datasets):
+    with h5py.File(path, 'w') as f:
+        for name, data in datasets.items():
+            f.create_dataset(name, data=data)
+
+
+@pytest.fixture
+def results_dir(tmp_path):
+    (tmp_path / 'raw').mkdir()
+    return tmp_path
+
+
+def test_load_field_common_locations(results_dir):
+    data = np.arange(12, dtype=np.float64).reshape(3, 4)
+    _write_h5(results_dir / 'raw' / 'top.h5', {'C': data})
+    _write_h5(results_dir / 'raw' / 'level.h5', {'level_0/C': data + 1})
+
+    analyzer = FieldAnalyzer(str(results_dir))
+    np.testing.assert_array_equal(analyzer.load_field('top.h5', 'C'), data)
+    np.testing.assert_array_equal(analyzer.load_field('level.h5', 'C'), data + 1)
+
+
+def test_load_field_does_not_match_name_elsewhere(results_dir):
+    # A dataset that merely shares the variable's name outside the known
+    # locations must not be picked up silently
+    _write_h5(results_dir / 'raw' / 'nested.h5',
+              {'diagnostics/history/C': np.zeros(4), 'U': np.ones(4)})
+
+    analyzer = FieldAnalyzer(str(results_dir))
+    with pytest.raises(KeyError, match="Variable 'C' not found"):
+        analyzer.load_field('nested.h5', 'C')
+
+
+def _fields_3d(dtype):
+    rng = np.random.default_rng(3)
+    field = (rng.random((5, 6, 7)) * 100).astype(dtype)
+    if field.dtype.kind == 'f':
+        field[2, 3, 4] = np.nan
+    return field
+
+
+def _baseline_slice(field, axis, index):
+    """2D slice as the original per-axis branches"""
+    if axis == 0:
+        return field[index, :, :]
+    elif axis == 1:
+        return field[:, index, :]
+    return field[:, :, index]
+
+
+def _baseline_centerline(field, axis):
+    """Centerline as the original per-axis branches"""
+    c = [s // 2 for s in field.shape]
+    if field.ndim == 2:
+        return field[:, c[1]] if axis == 0 else field[c[0], :]
+    if axis == 0:
+        return field[:, c[1], c[2]]
+    elif axis == 1:
+        return field[c[0], :, c[2]]
+    return field[c[0], c[1], :]
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.int32])
+@pytest.mark.parametrize('axis', [0, 1, 2])
+def test_extract_slices_2d_matches_baseline(dtype, axis):
+    field = _fields_3d(dtype)
+    indices = [0, 2, field.shape[axis] - 1, 2]
+
+    slices = fa.extract_slices_2d(field, axis, indices)
+    assert slices.dtype == field.dtype
+    assert slices.shape[0] == len(indices)
+    for k, index in enumerate(indices):
+        expected = _baseline_slice(field, axis, index)
+        np.testing.assert_array_equal(slices[k], expected)
+        np.testing.assert_array_equal(fa.extract_slice_2d(field, axis, index), expected)
+
+
+def test_extract_slices_2d_rejects_bad_input():
+    with pytest.raises(ValueError):
+        fa.extract_slices_2d(np.zeros((3, 4)), 0, [0])
+    with pytest.raises(ValueError):
+        fa.extract_slices_2d(np.zeros((3, 4, 5)), 3, [0])
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.int32])
+@pytest.mark.parametrize('shape,axis', [((6, 7), 0), ((6, 7), 1),
+                                        ((5, 6, 7), 0), ((5, 6, 7), 1), ((5, 6, 7), 2)])
+def test_extract_centerlines_batch_matches_baseline(dtype, shape, axis):
+    rng = np.random.default_rng(4)
+    fields = [(rng.random(shape) * 100).astype(dtype) for _ in range(3)]
+    if fields[0].dtype.kind == 'f':
+        # NaN on every centerline
+        fields[1][tuple(s // 2 for s in shape)] = np.nan
+
+    profiles = fa.extract_centerlines_batch(fields, axis)
+    assert profiles.dtype == fields[0].dtype
+    expected = np.stack([_baseline_centerline(f, axis) for f in fields])
+    np.testing.assert_array_equal(profiles, expected)
+
+
+def test_extract_centerlines_batch_rejects_mixed_shapes():
+    with pytest.raises(ValueError):
+        fa.extract_centerlines_batch([np.zeros((4, 4)), np.zeros((4, 5))], 0)
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32, np.int32, np.uint16])
+@pytest.mark.parametrize('timestep', [None, 1])
+def test_lazy_load_matches_eager(tmp_path, dtype, timestep):
+    rng = np.random.default_rng(5)
+    data = (rng.random((3, 8, 9)) * 100).astype(dtype)
+    if data.dtype.kind == 'f':
+        data[1, 2, 3] = np.nan
+    path = tmp_path / 'field.h5'
+    _write_h5(path, {'level_0/C': data})
+
+    # Original loader: read everything, then pick the timestep
+    with h5py.File(path, 'r') as f:
+        expected = f['level_0/C'][:]
+    if timestep is not None:
+        expected = expected[timestep]
+
+    fa.load_scalar_field.cache_clear()
+    eager = fa.load_scalar_field(str(path), 'C', timestep)
+    lazy = fa.load_scalar_field(str(path), 'C', timestep, lazy=True)
+
+    assert lazy.dtype == eager.dtype == expected.dtype
+    np.testing.assert_array_equal(lazy, expected)
+    np.testing.assert_array_equal(eager, expected)
+    assert not lazy.flags.writeable
+
+
+def test_lazy_load_rejects_chunked_dataset(tmp_path):
+    path = tmp_path / 'chunked.h5'
+    with h5py.File(path, 'w') as f:
+        f.create_dataset('C', data=np.ones((8, 8)), chunks=(4, 4), compression='gzip')
+
+    with pytest.raises(ValueError, match='cannot be memory-mapped'):
+        fa.load_scalar_field(str(path), 'C', lazy=True)
+    with pytest.raises(ValueError, match='only supported for HDF5'):
+        fa.load_scalar_field(str(tmp_path / 'field.csv'), lazy=True)
+
+
+def _baseline_statistics(field):
+    """Moments as the original np.min/np.max/np.mean/... calls"""
+    return {
+        'min': float(np.min(field)),
+        'max': float(np.max(field)),
+        'mean': float(np.mean(field)),
+        'std': float(np.std(field)),
+        'var': float(np.var(field)),
+        'sum': float(np.sum(field, dtype=np.float64)),
+        'median': float(np.median(field)),
+        'percentile_05': float(np.percentile(field, 5)),
+        'percentile_95': float(np.percentile(field, 95)),
+    }
+
+
+@pytest.mark.parametrize('shape', [(20, 30), pytest.param(LARGE_SHAPE, marks=requires_numba)])
+@pytest.mark.parametrize('dtype,with_nan', [(np.float64, False), (np.float64, True),
+                                            (np.int32, False), (np.int64, False)])
+def test_field_statistics_match_baseline(shape, dtype, with_nan):
+    rng = np.random.default_rng(6)
+    field = (rng.random(shape) * 1000).astype(dtype)
+    if with_nan:
+        field[7, 11] = np.nan
+
+    stats = fa.compute_field_statistics(field)
+    for key, value in _baseline_statistics(field).items():
+        if with_nan:
+            assert np.isnan(stats[key]), key
+        else:
+            assert stats[key] == pytest.approx(value, rel=1e-9), key
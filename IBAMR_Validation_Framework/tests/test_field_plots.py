@@ -0,0 +1,26 @@
+"""
+field_plots helpers against the original NumPy formulations.
+"""
+
+import numpy as np
+import pytest
+
+from validation_framework.plotting.field_plots import _abs_offset
+
+
+@pytest.mark.parametrize('dtype', [np.int8, np.uint8, np.int64, np.float16,
+                                   np.float32, np.float64])
+def test_abs_offset_keeps_zero_differences_positive(dtype):
+    diff = np.array([[0, 1], [-2, 3]]).astype(dtype)
+    expected = np.abs(diff.astype(np.float64)) + 1e-14
+
+    result = _abs_offset(diff.copy(), 1e-14)
+    # LogNorm masks values <= 0, so zero differences must keep the offset
+    assert (result > 0).all()
+    assert result.dtype == (dtype if dtype in (np.float32, np.float64) else np.float64)
+    np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
+def test_abs_offset_reuses_float_buffer():
+    diff = np.array([[-1.0, 2.0]])
+    assert _abs_offset(diff, 1e-14) is diff
@@ -0,0 +1,62 @@
+"""
+JSON helpers shared by the scripts and the report generator.
+"""
+
+import json
+import math
+
+import numpy as np
+import pytest
+
+from validation_framework import json_io
+
+
+@pytest.mark.parametrize('pretty', [False, True])
+def test_non_finite_floats_round_trip(tmp_path, pretty):
+    path = tmp_path / 'metrics.json'
+    data = {'L2': float('nan'), 'Linf': np.float64('inf'), 'L1': 1e-3,
+            'history': np.array([1.0, -np.inf])}
+    json_io.write_json(path, data, pretty=pretty)
+
+    loaded = json_io.read_json(path)
+    assert math.isnan(loaded['L2'])
+    assert loaded['Linf'] == float('inf')
+    assert loaded['L1'] == 1e-3
+    assert loaded['history'] == [1.0, -float('inf')]
+
+
+def test_reads_stdlib_json_literals(tmp_path):
+    path = tmp_path / 'metrics.json'
+    path.write_text(json.dumps({'Linf': float('nan')}))
+    assert math.isnan(json_io.read_json(path)['Linf'])
+
+
+def test_finite_data_round_trips(tmp_path):
+    path = tmp_path / 'result.json'
+    data = {'status': 'PASSED', 'duration': 1.5, 'values': np.arange(3.0), 'n': np.int64(4)}
+    json_io.write_json(path, data)
+    assert json_io.read_json(path) == {'status': 'PASSED', 'duration': 1.5,
+                                       'values': [0.0, 1.0, 2.0], 'n': 4}
+
+
+def test_fallback_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(json_io, 'orjson', None)
+    path = tmp_path / 'metrics.json'
+    json_io.write_json(path, {'L2': float('nan'), 'values': np.arange(2.0)})
+
+    loaded = json_io.read_json(path)
+    assert math.isnan(loaded['L2'])
+    assert loaded['values'] == [0.0, 1.0]
+
+
+@pytest.mark.parametrize('data,expected', [
+    (np.array([[1.0, 2.0], [3.0, np.nan]], dtype=np.float32), True),
+    (np.float32('inf'), True),
+    ([{'values': np.array([1.0, -np.inf])}], True),
+    (np.arange(4.0), False),
+    (np.arange(4), False),
+    (np.array([1.0, None, float('nan')], dtype=object), True),
+    ({'n': np.int64(3), 'name': 'Test01'}, False),
+])
+def test_has_non_finite(data, expected):
+    assert json_io._has_non_finite(data) is expected
@@ -0,0 +1,131 @@
+"""
+mass_conservation against the plain NumPy path and the original
+per-field formulas.
+"""
+
+import numpy as np
+import pytest
+
+from validation_framework.analysis import mass_conservation as mc
+
+
+def _baseline_changes(masses):
+    """Relative changes as the original per-mass list comprehension"""
+    M0 = masses[0]
+    return [(M - M0) / M0 if abs(M0) > 1e-14 else (M - M0) for M in masses]
+
+
+def test_integer_fields_relative_changes():
+    fields = [np.full((2, 5), 1, dtype=np.int64), np.full((2, 5), 1, dtype=np.int64),
+              np.array([[1] * 5, [1] * 4 + [2]], dtype=np.int64)]
+    result = mc.check_mass_conservation(fields)
+    assert result['relative_changes'] == pytest.approx([0.0, 0.0, 0.1])
+    assert result['max_relative_change'] == pytest.approx(0.1)
+
+    tracked = mc.track_mass_over_time(fields, [0.0, 1.0, 2.0])
+    assert tracked['relative_errors'] == pytest.approx([0.0, 0.0, 0.1])
+    assert tracked['max_drift'] == pytest.approx(0.1)
+    assert tracked['total_drift'] == pytest.approx(0.1)
+
+
+@pytest.mark.parametrize('dtype', [np.int32, np.int64, np.float32, np.float64])
+def test_masses_with_spacing(dtype):
+    rng = np.random.default_rng(1)
+    fields = [(rng.random((6, 7)) * 100).astype(dtype) for _ in range(4)]
+
+    result = mc.check_mass_conservation(fields, dx=0.5, dy=0.25)
+    expected = [float(np.sum(f, dtype=np.float64)) * 0.125 for f in fields]
+    assert result['masses'] == pytest.approx(expected, rel=1e-6)
+    assert result['relative_changes'] == pytest.approx(_baseline_changes(expected), rel=1e-6)
+
+
+def test_total_mass_tracks_readonly_view_of_changing_base():
+    base = np.ones((2, 5))
+    view = base.view()
+    view.flags.writeable = False
+
+    assert mc.compute_total_mass(view) == 10.0
+    base *= 2
+    assert mc.compute_total_mass(view) == 20.0
+
+
+def test_total_mass_accepts_array_spacing():
+    field = np.ones((4, 5))
+    assert mc.compute_total_mass(field, dx=np.array(0.5), dy=np.float64(0.25)) == pytest.approx(2.5)
+
+
+requires_numba = pytest.mark.skipif(not mc._HAVE_NUMBA, reason="numba not installed")
+
+# Small fields take the stacked NumPy reduction; large ones the Numba sums
+SMALL_SHAPE = (6, 7)
+LARGE_SHAPE = (400, 300)
+assert np.prod(LARGE_SHAPE) >= mc._NUMBA_MIN_SIZE
+
+
+def _baseline_masses(fields, dV=None):
+    """Masses as the original per-field np.sum(field * dV)"""
+    if dV is None:
+        return [float(np.sum(f)) for f in fields]
+    return [float(np.sum(f * dV)) for f in fields]
+
+
+def _series(shape, dtype, kind):
+    """Four fields of a mass series, with a NaN or a violation at step 2"""
+    rng = np.random.default_rng(2)
+    base = (rng.random(shape) * 100).astype(dtype)
+    fields = [base.copy() for _ in range(4)]
+    if kind == 'nan':
+        fields[2][1, 1] = np.nan
+    elif kind == 'violation':
+        fields[2][1, 1] += 50
+    return fields
+
+
+SERIES = [(np.float64, 'conserved'), (np.float64, 'violation'), (np.float64, 'nan'),
+          (np.int32, 'conserved'), (np.int64, 'violation')]
+
+
+@pytest.mark.parametrize('shape', [SMALL_SHAPE, LARGE_SHAPE])
+@pytest.mark.parametrize('dtype,kind', SERIES)
+@pytest.mark.parametrize('spacing', [{}, {'dx': 0.5, 'dy': 0.25}])
+def test_check_only_matches_full_check(shape, dtype, kind, spacing):
+    fields = _series(shape, dtype, kind)
+    tolerance = 1e-6
+
+    dV = 0.125 if spacing else None
+    masses = _baseline_masses(fields, dV)
+    changes = _baseline_changes(masses)
+    # A NaN change counts as a violation
+    violations = [i for i, change in enumerate(changes) if not abs(change) < tolerance]
+    expected_violation = violations[0] if violations else None
+
+    quick = mc.check_mass_conservation(fields, tolerance=tolerance, check_only=True, **spacing)
+    full = mc.check_mass_conservation(fields, tolerance=tolerance, **spacing)
+
+    assert quick['first_violation'] == expected_violation
+    assert quick['is_conserved'] == (expected_violation is None) == full['is_conserved']
+    assert quick['initial_mass'] == pytest.approx(masses[0], rel=1e-9)
+    assert quick['tolerance'] == tolerance
+
+
+@requires_numba
+@pytest.mark.parametrize('dtype,kind', SERIES)
+@pytest.mark.parametrize('spacing', [{}, {'dx': 0.5, 'dy': 0.25}])
+def test_numba_masses_match_numpy(monkeypatch, dtype, kind, spacing):
+    fields = _series(LARGE_SHAPE, dtype, kind)
+
+    with monkeypatch.context() as m:
+        m.setattr(mc, '_HAVE_NUMBA', False)
+        expected = mc.check_mass_conservation(fields, **spacing)
+    result = mc.check_mass_conservation(fields, **spacing)
+
+    baseline = _baseline_masses(fields, 0.125 if spacing else None)
+    np.testing.assert_allclose(result['masses'], baseline, rtol=1e-9)
+    for key in ('masses', 'relative_changes', 'absolute_changes'):
+        np.testing.assert_allclose(result[key], expected[key], rtol=1e-9, err_msg=key)
+    for key in ('max_relative_change', 'max_absolute_change', 'mean_mass', 'std_mass'):
+        if kind == 'nan':
+            assert np.isnan(expected[key]) and np.isnan(result[key]), key
+        else:
+            assert result[key] == pytest.approx(expected[key], rel=1e-9, abs=1e-9), key
+    assert result['is_conserved'] == expected['is_conserved']
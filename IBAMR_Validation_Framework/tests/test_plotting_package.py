@@ -0,0 +1,38 @@
+"""
+Lazy imports of the plotting package.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _loads_pyplot(statement):
+    """Whether running statement in a fresh interpreter imports pyplot"""
+    code = f"import sys\n{statement}\nprint('matplotlib.pyplot' in sys.modules)"
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return out.strip() == 'True'
+
+
+@pytest.mark.parametrize('statement', [
+    'import validation_framework.plotting',
+    'import validation_framework.plotting.convergence_plots',
+    'from validation_framework.plotting import plot_convergence_rate',
+    'from validation_framework.plotting import generate_plots',
+])
+def test_import_does_not_load_pyplot(statement):
+    assert not _loads_pyplot(statement)
+
+
+def test_public_names_resolve():
+    import validation_framework.plotting as plotting
+
+    for name in plotting.__all__:
+        assert callable(getattr(plotting, name)), name
+    with pytest.raises(AttributeError):
+        plotting.no_such_plot
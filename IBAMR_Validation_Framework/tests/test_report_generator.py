@@ -0,0 +1,28 @@
+"""
+Report generation from results directories.
+"""
+
+import json
+
+from validation_framework.reporting import report_generator as rg
+
+
+def _write_test(results_dir, name, status, metrics):
+    test_dir = results_dir / name
+    test_dir.mkdir(parents=True)
+    (test_dir / 'test_result.json').write_text(json.dumps({'status': status, 'duration': 1.0}))
+    # Stdlib json writes non-finite floats as NaN/Infinity literals
+    (test_dir / 'metrics.json').write_text(json.dumps(metrics))
+
+
+def test_report_reads_nan_metrics(tmp_path):
+    results_dir = tmp_path / 'results'
+    _write_test(results_dir, 'Test01_diverged', 'FAILED',
+                {'L2': float('nan'), 'Linf': float('inf')})
+    _write_test(results_dir, 'Test02_ok', 'PASSED', {'L2': 1e-3, 'Linf': 2e-3})
+
+    output = tmp_path / 'report.md'
+    rg.generate_compatibility_report(str(results_dir), str(output))
+
+    report = output.read_text()
+    assert '| Test01_diverged | ❌ FAILED | 1.0s | nan | inf |' in report
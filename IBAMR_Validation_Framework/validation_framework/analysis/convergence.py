@@ -5,13 +5,77 @@ Convergence Analysis Module
 Tools for computing and analyzing convergence rates.
 """
 
+import math
 import numpy as np
-from typing import List, Dict, Tuple, Optional
-from scipy import stats
+from typing import List, Dict, Tuple, Optional, Union
+from scipy import special
 
+ArrayLike = Union[List[float], np.ndarray]
 
-def compute_convergence_rate(errors: List[float],
-                             resolutions: List[float]) -> float:
+# Up to this many levels, EOC rows are computed with scalar math; NumPy's
+# per-call overhead dominates for the few levels of a typical study
+_SCALAR_EOC_MAX_LEVELS = 16
+
+
+def _linregress_small(x: np.ndarray,
+                      y: np.ndarray,
+                      compute_p_value: bool = True) -> Tuple[float, float, float, float, float]:
+    """
+    Closed-form least-squares line fit for short series.
+
+    Returns the same (slope, intercept, r_value, p_value, std_err) tuple as
+    scipy.stats.linregress, without its input-validation overhead, which
+    dominates for the handful of points in a convergence study. p_value is
+    NaN when compute_p_value is False.
+    """
+    n = x.size
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    dy = y - y_mean
+    ssxm = dx @ dx
+    ssym = dy @ dy
+    ssxym = dx @ dy
+
+    if ssxm == 0:
+        raise ValueError("Cannot fit a line if all x values are identical")
+
+    slope = ssxym / ssxm
+    intercept = y_mean - slope * x_mean
+
+    r_den = np.sqrt(ssxm * ssym)
+    r_value = np.nan if r_den == 0 else min(max(ssxym / r_den, -1.0), 1.0)
+
+    if n == 2:
+        # A line through two points is exact
+        p_value = (1.0 if y[0] == y[1] else 0.0) if compute_p_value else np.nan
+        std_err = 0.0
+    else:
+        df = n - 2
+        std_err = np.sqrt((1 - r_value**2) * ssym / ssxm / df)
+        if compute_p_value:
+            tiny = 1.0e-20
+            t = r_value * np.sqrt(df / ((1.0 - r_value + tiny) * (1.0 + r_value + tiny)))
+            p_value = 2 * special.stdtr(df, -abs(t))
+        else:
+            p_value = np.nan
+
+    return slope, intercept, r_value, p_value, std_err
+
+
+def _prepare(errors: ArrayLike,
+             resolutions: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    log(errors) and log(resolutions) as float64 arrays. np.asarray does
+    not copy inputs that already are float64 arrays.
+    """
+    log_e = np.log(np.asarray(errors, dtype=np.float64))
+    log_h = np.log(np.asarray(resolutions, dtype=np.float64))
+    return log_e, log_h
+
+
+def compute_convergence_rate(errors: ArrayLike,
+                             resolutions: ArrayLike) -> float:
     """
     Compute convergence rate from error vs resolution data.
 
@@ -20,9 +84,9 @@ def compute_convergence_rate(errors: List[float],
 
     Parameters:
     -----------
-    errors : list of float
+    errors : list of float or np.ndarray
         Error values at different resolutions
-    resolutions : list of float
+    resolutions : list of float or np.ndarray
         Grid resolutions (h = dx)
 
     Returns:
@@ -32,26 +96,25 @@ def compute_convergence_rate(errors: List[float],
     assert len(errors) == len(resolutions), "Arrays must have same length"
     assert len(errors) >= 2, "Need at least 2 data points"
 
-    # Convert to numpy arrays and take log
-    log_h = np.log(np.array(resolutions))
-    log_e = np.log(np.array(errors))
+    log_e, log_h = _prepare(errors, resolutions)
 
     # Linear regression: log(e) = log(C) + p*log(h)
-    slope, intercept, r_value, p_value, std_err = stats.linregress(log_h, log_e)
+    slope, intercept, r_value, p_value, std_err = _linregress_small(
+        log_h, log_e, compute_p_value=False)
 
     return slope
 
 
-def analyze_convergence_series(errors: List[float],
-                               resolutions: List[float]) -> Dict:
+def analyze_convergence_series(errors: ArrayLike,
+                               resolutions: ArrayLike) -> Dict:
     """
     Perform comprehensive convergence analysis.
 
     Parameters:
     -----------
-    errors : list of float
+    errors : list of float or np.ndarray
         Error values at different resolutions
-    resolutions : list of float
+    resolutions : list of float or np.ndarray
         Grid resolutions (h = dx)
 
     Returns:
@@ -67,16 +130,12 @@ def analyze_convergence_series(errors: List[float],
         }
 
     # Compute overall convergence rate
-    log_h = np.log(np.array(resolutions))
-    log_e = np.log(np.array(errors))
+    log_e, log_h = _prepare(errors, resolutions)
 
-    slope, intercept, r_value, p_value, std_err = stats.linregress(log_h, log_e)
+    slope, intercept, r_value, p_value, std_err = _linregress_small(log_h, log_e)
 
-    # Compute pairwise convergence rates
-    pairwise_rates = []
-    for i in range(len(errors) - 1):
-        rate = np.log(errors[i+1] / errors[i]) / np.log(resolutions[i+1] / resolutions[i])
-        pairwise_rates.append(rate)
+    # Compute pairwise convergence rates from the logs already taken
+    pairwise_rates = (np.diff(log_e) / np.diff(log_h)).tolist()
 
     results = {
         'convergence_rate': slope,
@@ -86,7 +145,7 @@ def analyze_convergence_series(errors: List[float],
         'pairwise_rates': pairwise_rates,
         'mean_pairwise_rate': np.mean(pairwise_rates),
         'std_pairwise_rate': np.std(pairwise_rates),
-        'fit_constant': np.exp(intercept),
+        'fit_constant': math.exp(intercept),
         'resolutions': resolutions,
         'errors': errors,
     }
@@ -94,17 +153,17 @@ def analyze_convergence_series(errors: List[float],
     return results
 
 
-def fit_convergence_order(errors: List[float],
-                          resolutions: List[float],
+def fit_convergence_order(errors: ArrayLike,
+                          resolutions: ArrayLike,
                           expected_order: Optional[float] = None) -> Dict:
     """
     Fit convergence order and compare with expected.
 
     Parameters:
     -----------
-    errors : list of float
+    errors : list of float or np.ndarray
         Error values
-    resolutions : list of float
+    resolutions : list of float or np.ndarray
         Grid resolutions
     expected_order : float, optional
         Expected convergence order for comparison
@@ -138,6 +197,8 @@ def compute_richardson_extrapolation(f_fine: float,
 
     f_exact ≈ (r^p * f_fine - f_coarse) / (r^p - 1)
 
+    Inputs are scalars; plain float arithmetic is used throughout.
+
     Parameters:
     -----------
     f_fine : float
@@ -157,6 +218,15 @@ def compute_richardson_extrapolation(f_fine: float,
     return (r_p * f_fine - f_coarse) / (r_p - 1)
 
 
+def _divide(a: float, b: float) -> float:
+    """a / b with IEEE semantics: +-inf or NaN instead of ZeroDivisionError"""
+    if b == 0:
+        if a == 0 or math.isnan(a):
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return a / b
+
+
 def estimate_discretization_error(f_fine: float,
                                   f_medium: float,
                                   f_coarse: float,
@@ -188,18 +258,20 @@ def estimate_discretization_error(f_fine: float,
         }
 
     # Use ln to handle cases where ratio might be negative
+    # (all scalars, so math is used instead of the slower NumPy ufuncs)
     r = refinement_ratio
-    s = np.sign(epsilon_32 / epsilon_21)
-    p = np.log(abs(epsilon_32 / epsilon_21)) / np.log(r)
+    s = math.copysign(1.0, epsilon_32 / epsilon_21)
+    p = _divide(math.log(abs(epsilon_32 / epsilon_21)), math.log(r))
 
-    # Grid Convergence Index
+    # Grid Convergence Index; r**p == 1 (apparent order 0 or r == 1) gives
+    # an infinite error estimate
     factor_safety = 1.25  # Safety factor
-    GCI_fine = factor_safety * abs(epsilon_21) / (r**p - 1)
+    GCI_fine = _divide(factor_safety * abs(epsilon_21), r**p - 1)
 
     results = {
         'apparent_order': p,
         'GCI_fine': GCI_fine,
-        'extrapolated_value': f_fine + epsilon_21 / (r**p - 1),
+        'extrapolated_value': f_fine + _divide(epsilon_21, r**p - 1),
         'relative_error_estimate': GCI_fine / abs(f_fine) if abs(f_fine) > 1e-14 else GCI_fine,
         'asymptotic_range': abs(GCI_fine / f_fine) < 0.05 if abs(f_fine) > 1e-14 else False,
     }
@@ -207,44 +279,104 @@ def estimate_discretization_error(f_fine: float,
     return results
 
 
-def compute_eoc_table(errors: List[float],
-                     resolutions: List[float]) -> List[Dict]:
+def compute_eoc_table_soa(errors: ArrayLike,
+                         resolutions: ArrayLike) -> Dict[str, np.ndarray]:
+    """
+    Compute Experimental Order of Convergence (EOC) table as columns.
+
+    Parameters:
+    -----------
+    errors : list of float or np.ndarray
+        Error values
+    resolutions : list of float or np.ndarray
+        Grid resolutions
+
+    Returns:
+    --------
+    dict : Column name -> array with one value per level. 'eoc' and
+        'reduction_factor' are NaN on the coarsest level.
+    """
+    e = np.asarray(errors, dtype=np.float64)
+    h = np.asarray(resolutions, dtype=np.float64)
+    log_e, log_h = _prepare(e, h)
+
+    # Ratios between successive levels, padded so every column has one
+    # entry per level
+    e_ratio = np.full(e.size, np.nan)
+    eoc = np.full(e.size, np.nan)
+    e_ratio[1:] = e[1:] / e[:-1]
+    eoc[1:] = np.diff(log_e) / np.diff(log_h)
+
+    return {
+        'level': np.arange(e.size),
+        'resolution': h,
+        'error': e,
+        'eoc': eoc,
+        'reduction_factor': e_ratio,
+    }
+
+
+def compute_eoc_table(errors: ArrayLike,
+                     resolutions: ArrayLike) -> List[Dict]:
     """
     Compute Experimental Order of Convergence (EOC) table.
 
+    Row-per-level view of compute_eoc_table_soa.
+
     Parameters:
     -----------
-    errors : list of float
+    errors : list of float or np.ndarray
         Error values
-    resolutions : list of float
+    resolutions : list of float or np.ndarray
         Grid resolutions
 
     Returns:
     --------
     list of dict : EOC table entries
     """
-    table = []
+    if len(errors) <= _SCALAR_EOC_MAX_LEVELS:
+        columns = _eoc_columns_scalar(errors, resolutions)
+    else:
+        columns = None
+    if columns is None:
+        columns = {key: values.tolist()
+                   for key, values in compute_eoc_table_soa(errors, resolutions).items()}
+    table = [dict(zip(columns, row)) for row in zip(*columns.values())]
 
-    for i in range(len(errors)):
-        entry = {
-            'level': i,
-            'resolution': resolutions[i],
-            'error': errors[i],
-        }
+    # The coarsest level has nothing to compare against
+    if table:
+        table[0]['eoc'] = None
+        table[0]['reduction_factor'] = None
 
-        if i > 0:
-            h_ratio = resolutions[i] / resolutions[i-1]
-            e_ratio = errors[i] / errors[i-1]
-            eoc = np.log(e_ratio) / np.log(h_ratio)
-            entry['eoc'] = eoc
-            entry['reduction_factor'] = e_ratio
-        else:
-            entry['eoc'] = None
-            entry['reduction_factor'] = None
+    return table
 
-        table.append(entry)
 
-    return table
+def _eoc_columns_scalar(errors: ArrayLike,
+                        resolutions: ArrayLike) -> Optional[Dict[str, List]]:
+    """
+    compute_eoc_table_soa columns as lists, using math on Python floats.
+    Returns None for zero/negative errors or repeated resolutions, which
+    are left to NumPy's inf/nan handling.
+    """
+    e = [float(value) for value in errors]
+    h = [float(value) for value in resolutions]
+
+    try:
+        log_e = [math.log(value) for value in e]
+        log_h = [math.log(value) for value in h]
+        eoc = [(log_e[i] - log_e[i-1]) / (log_h[i] - log_h[i-1])
+               for i in range(1, len(e))]
+        reduction_factor = [e[i] / e[i-1] for i in range(1, len(e))]
+    except (ValueError, ZeroDivisionError):
+        return None
+
+    return {
+        'level': list(range(len(e))),
+        'resolution': h,
+        'error': e,
+        'eoc': [math.nan] + eoc,
+        'reduction_factor': [math.nan] + reduction_factor,
+    }
 
 
 def assess_convergence_quality(convergence_rate: float,
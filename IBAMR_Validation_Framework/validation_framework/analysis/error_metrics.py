@@ -9,6 +9,23 @@ scalar field comparisons.
 import numpy as np
 from typing import Dict, Tuple, Optional, Union
 
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Fields below this size are cheaper to reduce with plain NumPy than to
+# dispatch to the threaded kernel
+_NUMBA_MIN_SIZE = 100_000
+
+# fastmath without 'nnan'/'ninf' so NaN/Inf in a field still poison the sums
+_FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# Cell volume: a scalar for uniform grids, or per-axis spacing arrays whose
+# outer product is the volume (see _compute_cell_volume)
+CellVolume = Union[float, Tuple[np.ndarray, ...]]
+
 
 def compute_l1_error(computed: np.ndarray,
                      exact: np.ndarray,
@@ -35,25 +52,18 @@ def compute_l1_error(computed: np.ndarray,
     """
     assert computed.shape == exact.shape, "Field shapes must match"
 
+    dV = _optional_cell_volume(computed.shape, dx, dy, dz)
+
+    if _use_numba(computed):
+        # Fused subtract-abs-(weight)-sum, no temporaries
+        num, den = _kernel_sums(_l1_kernel, _l1_kernel_weighted, computed, exact, dV)
+        return _l1_ratio(num, den, computed.size)
+
     # Compute absolute difference
     abs_diff = np.abs(computed - exact)
     abs_exact = np.abs(exact)
 
-    # Compute cell volumes
-    if dx is not None or dy is not None or dz is not None:
-        dV = _compute_cell_volume(computed.shape, dx, dy, dz)
-        numerator = np.sum(abs_diff * dV)
-        denominator = np.sum(abs_exact * dV)
-    else:
-        numerator = np.sum(abs_diff)
-        denominator = np.sum(abs_exact)
-
-    # Avoid division by zero
-    if denominator < 1e-14:
-        # If exact solution is zero, return absolute error
-        return numerator / computed.size
-
-    return numerator / denominator
+    return _l1_norm(abs_diff, abs_exact, dV)
 
 
 def compute_l2_error(computed: np.ndarray,
@@ -81,25 +91,17 @@ def compute_l2_error(computed: np.ndarray,
     """
     assert computed.shape == exact.shape, "Field shapes must match"
 
-    # Compute squared difference
-    diff_squared = (computed - exact) ** 2
-    exact_squared = exact ** 2
-
-    # Compute cell volumes
-    if dx is not None or dy is not None or dz is not None:
-        dV = _compute_cell_volume(computed.shape, dx, dy, dz)
-        numerator = np.sqrt(np.sum(diff_squared * dV))
-        denominator = np.sqrt(np.sum(exact_squared * dV))
-    else:
-        numerator = np.sqrt(np.sum(diff_squared))
-        denominator = np.sqrt(np.sum(exact_squared))
+    dV = _optional_cell_volume(computed.shape, dx, dy, dz)
 
-    # Avoid division by zero
-    if denominator < 1e-14:
-        # If exact solution is zero, return RMS error
-        return numerator / np.sqrt(computed.size)
+    if _use_numba(computed):
+        num, den = _kernel_sums(_l2_kernel, _l2_kernel_weighted, computed, exact, dV)
+        return _l2_ratio(num, den, computed.size)
 
-    return numerator / denominator
+    # Compute squared difference
+    diff_squared = np.square(computed - exact)
+    exact_squared = np.square(exact)
+
+    return _l2_norm(diff_squared, exact_squared, dV)
 
 
 def compute_linf_error(computed: np.ndarray,
@@ -122,14 +124,15 @@ def compute_linf_error(computed: np.ndarray,
     """
     assert computed.shape == exact.shape, "Field shapes must match"
 
-    max_diff = np.max(np.abs(computed - exact))
-    max_exact = np.max(np.abs(exact))
+    if _use_numba(computed):
+        return _linf_ratio(*_linf_kernel(_flat_view(computed), _flat_view(exact)))
 
-    # Avoid division by zero
-    if max_exact < 1e-14:
-        return max_diff
+    # One temporary for the difference, made absolute in place; max|exact|
+    # needs no temporary at all
+    abs_diff = np.subtract(computed, exact)
+    np.abs(abs_diff, out=abs_diff)
 
-    return max_diff / max_exact
+    return _linf_ratio(np.max(abs_diff), _absmax(exact))
 
 
 def compute_all_errors(computed: np.ndarray,
@@ -153,13 +156,26 @@ def compute_all_errors(computed: np.ndarray,
     --------
     dict : Dictionary containing all error metrics
     """
+    assert computed.shape == exact.shape, "Field shapes must match"
+
+    if _use_numba(computed):
+        return _compute_all_errors_fused(
+            computed, exact, _optional_cell_volume(computed.shape, dx, dy, dz))
+
+    # Compute the difference fields once and share them across all norms
+    diff = computed - exact
+    abs_diff = np.abs(diff)
+    diff_squared = np.square(diff)
+    abs_exact = np.abs(exact)
+    dV = _optional_cell_volume(computed.shape, dx, dy, dz)
+
     errors = {
-        'L1': compute_l1_error(computed, exact, dx, dy, dz),
-        'L2': compute_l2_error(computed, exact, dx, dy, dz),
-        'Linf': compute_linf_error(computed, exact),
-        'max_abs_error': np.max(np.abs(computed - exact)),
-        'mean_abs_error': np.mean(np.abs(computed - exact)),
-        'rms_error': np.sqrt(np.mean((computed - exact) ** 2)),
+        'L1': _l1_norm(abs_diff, abs_exact, dV),
+        'L2': _l2_norm(diff_squared, np.square(exact), dV),
+        'Linf': _linf_norm(abs_diff, abs_exact),
+        'max_abs_error': np.max(abs_diff),
+        'mean_abs_error': np.mean(abs_diff),
+        'rms_error': np.sqrt(np.mean(diff_squared)),
     }
 
     return errors
@@ -186,7 +202,8 @@ def compute_pointwise_error(computed: np.ndarray,
 
 def compute_relative_error(computed: np.ndarray,
                           exact: np.ndarray,
-                          epsilon: float = 1e-14) -> np.ndarray:
+                          epsilon: float = 1e-14,
+                          out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Compute pointwise relative error.
 
@@ -200,21 +217,374 @@ def compute_relative_error(computed: np.ndarray,
         Exact/reference scalar field
     epsilon : float
         Small value to avoid division by zero
+    out : np.ndarray, optional
+        Array to write the result into, e.g. reused across calls
 
     Returns:
     --------
     np.ndarray : Pointwise relative error field
     """
-    return np.abs(computed - exact) / (np.abs(exact) + epsilon)
+    if out is None:
+        out = np.empty(np.broadcast_shapes(computed.shape, exact.shape),
+                       dtype=np.result_type(computed, exact, epsilon))
+
+    if (_use_numba(out) and computed.shape == exact.shape == out.shape
+            and out.flags.c_contiguous):
+        _relative_error_kernel(_flat_view(computed), _flat_view(exact),
+                               epsilon, out.reshape(-1))
+        return out
+
+    # |computed - exact| in place in out, so only the denominator is a
+    # temporary
+    np.subtract(computed, exact, out=out)
+    np.abs(out, out=out)
+    denominator = np.abs(exact, dtype=out.dtype)
+    denominator += epsilon
+    return np.divide(out, denominator, out=out)
+
+
+def _optional_cell_volume(shape: Tuple[int, ...],
+                          dx: Optional[Union[float, np.ndarray]] = None,
+                          dy: Optional[Union[float, np.ndarray]] = None,
+                          dz: Optional[Union[float, np.ndarray]] = None) -> Optional[CellVolume]:
+    """Cell volumes if any grid spacing is given, otherwise None"""
+    if dx is None and dy is None and dz is None:
+        return None
+    return _compute_cell_volume(shape, dx, dy, dz)
+
+
+def _integrate(values: np.ndarray, dV: Optional[CellVolume]) -> float:
+    """Sum of values weighted by cell volume, without materializing dV"""
+    if dV is None:
+        return np.sum(values)
+    if not isinstance(dV, tuple):
+        return dV * np.sum(values)
+
+    # Separable volumes: contract each axis against its spacing
+    axes = list(range(values.ndim))
+    operands = [values, axes]
+    for axis, spacing in enumerate(dV):
+        operands += [spacing, [axis]]
+    return np.einsum(*operands, [])
+
+
+def _l1_norm(abs_diff: np.ndarray,
+             abs_exact: np.ndarray,
+             dV: Optional[CellVolume] = None) -> float:
+    """Normalized L1 norm from precomputed |computed - exact| and |exact|"""
+    numerator = _integrate(abs_diff, dV)
+    denominator = _integrate(abs_exact, dV)
+
+    return _l1_ratio(numerator, denominator, abs_diff.size)
+
+
+def _l1_ratio(numerator: float, denominator: float, size: int) -> float:
+    """Normalize an integrated absolute error by the integrated |exact|"""
+    # Avoid division by zero
+    if denominator < 1e-14:
+        # If exact solution is zero, return absolute error
+        return numerator / size
+
+    return numerator / denominator
+
+
+def _l2_norm(diff_squared: np.ndarray,
+             exact_squared: np.ndarray,
+             dV: Optional[CellVolume] = None) -> float:
+    """Normalized L2 norm from precomputed (computed - exact)² and exact²"""
+    sum_diff_squared = _integrate(diff_squared, dV)
+    sum_exact_squared = _integrate(exact_squared, dV)
+
+    return _l2_ratio(sum_diff_squared, sum_exact_squared, diff_squared.size)
+
+
+def _l2_ratio(sum_diff_squared: float,
+              sum_exact_squared: float,
+              size: int) -> float:
+    """Normalize an integrated squared error by the integrated exact²"""
+    numerator = np.sqrt(sum_diff_squared)
+    denominator = np.sqrt(sum_exact_squared)
+
+    # Avoid division by zero
+    if denominator < 1e-14:
+        # If exact solution is zero, return RMS error
+        return numerator / np.sqrt(size)
+
+    return numerator / denominator
+
+
+def _linf_norm(abs_diff: np.ndarray,
+               abs_exact: np.ndarray) -> float:
+    """Normalized L∞ norm from precomputed |computed - exact| and |exact|"""
+    return _linf_ratio(np.max(abs_diff), np.max(abs_exact))
+
+
+def _absmax(values: np.ndarray) -> float:
+    """max|values| from the extrema, without allocating |values|"""
+    # Negate in float64: for unsigned and the most negative signed integers,
+    # -min wraps around in the input dtype
+    return np.maximum(np.float64(np.max(values)), -np.float64(np.min(values)))
+
+
+def _linf_ratio(max_diff: float, max_exact: float) -> float:
+    """Normalize a maximum error by max|exact|"""
+    # Avoid division by zero
+    if max_exact < 1e-14:
+        return max_diff
+
+    return max_diff / max_exact
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _nan_if(value, nan_count):
+        """value, or NaN if any NaN was seen (as np.max would return)"""
+        return np.nan if nan_count > 0 else value
+
+    @njit(cache=True, parallel=True, fastmath=_FASTMATH_FLAGS)
+    def _all_errors_kernel(computed, exact):
+        """
+        Single streaming pass over flat arrays accumulating every reduction
+        needed by compute_all_errors when no grid spacing is given.
+        """
+        sum_abs_diff = 0.0
+        sum_abs_exact = 0.0
+        sum_diff_squared = 0.0
+        sum_exact_squared = 0.0
+        max_abs_diff = 0.0
+        max_abs_exact = 0.0
+        nan_diff = 0
+        nan_exact = 0
+
+        for i in prange(computed.size):
+            d = computed[i] - exact[i]
+            ad = abs(d)
+            ae = abs(exact[i])
+
+            sum_abs_diff += ad
+            sum_abs_exact += ae
+            sum_diff_squared += d * d
+            sum_exact_squared += exact[i] * exact[i]
+            max_abs_diff = max(max_abs_diff, ad)
+            max_abs_exact = max(max_abs_exact, ae)
+            # max() drops NaN; count them so the maxima can be poisoned
+            if ad != ad:
+                nan_diff += 1
+            if ae != ae:
+                nan_exact += 1
+
+        return (sum_abs_diff, sum_abs_exact,
+                sum_diff_squared, sum_exact_squared,
+                _nan_if(max_abs_diff, nan_diff), _nan_if(max_abs_exact, nan_exact))
+
+    @njit(cache=True, parallel=True, fastmath=_FASTMATH_FLAGS)
+    def _all_errors_kernel_weighted(computed, exact, row_w, col_w):
+        """
+        Volume-weighted variant of _all_errors_kernel over (rows, cols)
+        views with cell volume row_w[r] * col_w[j]; the unweighted sums are
+        still needed for mean_abs_error and rms_error.
+        """
+        w_sum_abs_diff = 0.0
+        w_sum_abs_exact = 0.0
+        w_sum_diff_squared = 0.0
+        w_sum_exact_squared = 0.0
+        sum_abs_diff = 0.0
+        sum_diff_squared = 0.0
+        max_abs_diff = 0.0
+        max_abs_exact = 0.0
+        nan_diff = 0
+        nan_exact = 0
+
+        for r in prange(computed.shape[0]):
+            wr = row_w[r]
+            for j in range(computed.shape[1]):
+                d = computed[r, j] - exact[r, j]
+                ad = abs(d)
+                ae = abs(exact[r, j])
+                d2 = d * d
+                w = wr * col_w[j]
+
+                sum_abs_diff += ad
+                sum_diff_squared += d2
+                w_sum_abs_diff += ad * w
+                w_sum_abs_exact += ae * w
+                w_sum_diff_squared += d2 * w
+                w_sum_exact_squared += exact[r, j] * exact[r, j] * w
+                max_abs_diff = max(max_abs_diff, ad)
+                max_abs_exact = max(max_abs_exact, ae)
+                if ad != ad:
+                    nan_diff += 1
+                if ae != ae:
+                    nan_exact += 1
+
+        return (w_sum_abs_diff, w_sum_abs_exact,
+                w_sum_diff_squared, w_sum_exact_squared,
+                sum_abs_diff, sum_diff_squared,
+                _nan_if(max_abs_diff, nan_diff), _nan_if(max_abs_exact, nan_exact))
+
+    @njit(cache=True, parallel=True, fastmath=_FASTMATH_FLAGS)
+    def _l1_kernel(computed, exact):
+        """Unweighted L1 sums (sum|c - e|, sum|e|) in one pass"""
+        num = 0.0
+        den = 0.0
+        for i in prange(computed.size):
+            num += abs(computed[i] - exact[i])
+            den += abs(exact[i])
+        return num, den
+
+    @njit(cache=True, parallel=True, fastmath=_FASTMATH_FLAGS)
+    def _l1_kernel_weighted(computed, exact, row_w, col_w):
+        """Volume-weighted L1 sums (sum|c - e|dV, sum|e|dV) in one pass"""
+        num = 0.0
+        den = 0.0
+        for r in prange(computed.shape[0]):
+            wr = row_w[r]
+            for j in range(computed.shape[1]):
+                w = wr * col_w[j]
+                num += abs(computed[r, j] - exact[r, j]) * w
+                den += abs(exact[r, j]) * w
+        return num, den
+
+    @njit(cache=True, parallel=True, fastmath=_FASTMATH_FLAGS)
+    def _l2_kernel(computed, exact):
+        """Unweighted L2 sums (sum(c - e)^2, sum e^2) in one pass"""
+        num = 0.0
+        den = 0.0
+        for i in prange(computed.size):
+            d = computed[i] - exact[i]
+            num += d * d
+            den += exact[i] * exact[i]
+        return num, den
+
+    @njit(cache=True, parallel=True, fastmath=_FASTMATH_FLAGS)
+    def _l2_kernel_weighted(computed, exact, row_w, col_w):
+        """Volume-weighted L2 sums (sum(c - e)^2 dV, sum e^2 dV) in one pass"""
+        num = 0.0
+        den = 0.0
+        for r in prange(computed.shape[0]):
+            wr = row_w[r]
+            for j in range(computed.shape[1]):
+                w = wr * col_w[j]
+                d = computed[r, j] - exact[r, j]
+                num += d * d * w
+                den += exact[r, j] * exact[r, j] * w
+        return num, den
+
+    @njit(cache=True, parallel=True, fastmath=_FASTMATH_FLAGS)
+    def _linf_kernel(computed, exact):
+        """Maxima (max|c - e|, max|e|) in one pass"""
+        max_abs_diff = 0.0
+        max_abs_exact = 0.0
+        nan_diff = 0
+        nan_exact = 0
+        for i in prange(computed.size):
+            ad = abs(computed[i] - exact[i])
+            ae = abs(exact[i])
+            max_abs_diff = max(max_abs_diff, ad)
+            max_abs_exact = max(max_abs_exact, ae)
+            # max() drops NaN; count them so the maxima can be poisoned
+            if ad != ad:
+                nan_diff += 1
+            if ae != ae:
+                nan_exact += 1
+        return _nan_if(max_abs_diff, nan_diff), _nan_if(max_abs_exact, nan_exact)
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True, parallel=True, fastmath=_FASTMATH_FLAGS)
+    def _relative_error_kernel(computed, exact, epsilon, out):
+        """out = |c - e| / (|e| + epsilon), pointwise over flat arrays"""
+        for i in prange(computed.size):
+            out[i] = abs(computed[i] - exact[i]) / (abs(exact[i]) + epsilon)
+
+
+def _use_numba(computed: np.ndarray) -> bool:
+    """Whether a field is large enough for the Numba kernels to pay off"""
+    return _HAVE_NUMBA and computed.size >= _NUMBA_MIN_SIZE
+
+
+def _flat_view(array: np.ndarray) -> np.ndarray:
+    """Contiguous 1-D view of an array (copies only if non-contiguous)"""
+    return np.ascontiguousarray(array).ravel()
+
+
+def _row_view(array: np.ndarray) -> np.ndarray:
+    """Contiguous (rows, last axis) view of an array for the weighted kernels"""
+    array = np.ascontiguousarray(array)
+    return array.reshape(-1, array.shape[-1])
+
+
+def _row_col_weights(dV: Tuple[np.ndarray, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split separable cell volumes into per-row and per-column factors
+    matching _row_view, so the kernels form dV = row_w[r] * col_w[j] inline.
+    """
+    *leading, col_w = dV
+    row_w = np.ones(1)
+    for spacing in leading:
+        row_w = np.multiply.outer(row_w, spacing).ravel()
+    return row_w, np.asarray(col_w, dtype=np.float64)
+
+
+def _kernel_sums(kernel, weighted_kernel, computed: np.ndarray,
+                 exact: np.ndarray, dV: Optional[CellVolume]) -> Tuple[float, float]:
+    """Run an unweighted/weighted pair of sum kernels for the given cell volume"""
+    if dV is None or not isinstance(dV, tuple):
+        num, den = kernel(_flat_view(computed), _flat_view(exact))
+        if dV is not None:
+            # Uniform grid: factor the constant volume out of the loop
+            num, den = num * dV, den * dV
+        return num, den
+
+    return weighted_kernel(_row_view(computed), _row_view(exact),
+                           *_row_col_weights(dV))
+
+
+def _compute_all_errors_fused(computed: np.ndarray,
+                              exact: np.ndarray,
+                              dV: Optional[CellVolume]) -> Dict[str, float]:
+    """compute_all_errors via the single-pass Numba kernel"""
+    size = computed.size
+
+    if dV is None or not isinstance(dV, tuple):
+        (sum_abs_diff, sum_abs_exact,
+         sum_diff_squared, sum_exact_squared,
+         max_abs_diff, max_abs_exact) = _all_errors_kernel(_flat_view(computed),
+                                                          _flat_view(exact))
+        # Without weights (or with a uniform volume) the integrated sums
+        # are the plain sums, scaled
+        scale = 1.0 if dV is None else dV
+        w_sum_abs_diff, w_sum_abs_exact = sum_abs_diff * scale, sum_abs_exact * scale
+        w_sum_diff_squared = sum_diff_squared * scale
+        w_sum_exact_squared = sum_exact_squared * scale
+    else:
+        (w_sum_abs_diff, w_sum_abs_exact,
+         w_sum_diff_squared, w_sum_exact_squared,
+         sum_abs_diff, sum_diff_squared,
+         max_abs_diff, max_abs_exact) = _all_errors_kernel_weighted(
+            _row_view(computed), _row_view(exact), *_row_col_weights(dV))
+
+    return {
+        'L1': _l1_ratio(w_sum_abs_diff, w_sum_abs_exact, size),
+        'L2': _l2_ratio(w_sum_diff_squared, w_sum_exact_squared, size),
+        'Linf': _linf_ratio(max_abs_diff, max_abs_exact),
+        'max_abs_error': max_abs_diff,
+        'mean_abs_error': sum_abs_diff / size,
+        'rms_error': np.sqrt(sum_diff_squared / size),
+    }
 
 
 def _compute_cell_volume(shape: Tuple[int, ...],
                         dx: Optional[Union[float, np.ndarray]] = None,
                         dy: Optional[Union[float, np.ndarray]] = None,
-                        dz: Optional[Union[float, np.ndarray]] = None) -> np.ndarray:
+                        dz: Optional[Union[float, np.ndarray]] = None) -> CellVolume:
     """
     Compute cell volumes for integration.
 
+    The full volume array is never materialized: uniform grids give a
+    single scalar, non-uniform grids a tuple of per-axis spacing arrays
+    whose outer product is the cell volume.
+
     Parameters:
     -----------
     shape : tuple
@@ -224,58 +594,23 @@ def _compute_cell_volume(shape: Tuple[int, ...],
 
     Returns:
     --------
-    np.ndarray : Cell volume array
+    float or tuple of np.ndarray : Cell volume
     """
     ndim = len(shape)
 
-    if ndim == 1:
-        if dx is None:
-            dx = 1.0
-        if isinstance(dx, (int, float)):
-            return np.full(shape, dx)
-        else:
-            return dx
-
-    elif ndim == 2:
-        if dx is None:
-            dx = 1.0
-        if dy is None:
-            dy = 1.0
-
-        if isinstance(dx, (int, float)) and isinstance(dy, (int, float)):
-            return np.full(shape, dx * dy)
-        else:
-            # Handle non-uniform grids
-            if isinstance(dx, (int, float)):
-                dx_array = np.full(shape[0], dx)
-            else:
-                dx_array = dx
-
-            if isinstance(dy, (int, float)):
-                dy_array = np.full(shape[1], dy)
-            else:
-                dy_array = dy
-
-            return np.outer(dx_array, dy_array)
-
-    elif ndim == 3:
-        if dx is None:
-            dx = 1.0
-        if dy is None:
-            dy = 1.0
-        if dz is None:
-            dz = 1.0
-
-        if isinstance(dx, (int, float)) and isinstance(dy, (int, float)) and isinstance(dz, (int, float)):
-            return np.full(shape, dx * dy * dz)
-        else:
-            # Handle non-uniform grids (simplified)
-            # For full non-uniform 3D grids, this would need more sophisticated handling
-            return np.full(shape, float(dx) * float(dy) * float(dz))
-
-    else:
+    if ndim not in (1, 2, 3):
         raise ValueError(f"Unsupported number of dimensions: {ndim}")
 
+    spacings = [1.0 if h is None else h for h in (dx, dy, dz)[:ndim]]
+
+    if all(np.ndim(h) == 0 for h in spacings):
+        return float(np.prod(spacings))
+
+    # Handle non-uniform grids
+    return tuple(np.full(n, h, dtype=np.float64) if np.ndim(h) == 0
+                 else np.asarray(h, dtype=np.float64)
+                 for n, h in zip(shape, spacings))
+
 
 def compute_error_statistics(computed: np.ndarray,
                              exact: np.ndarray) -> Dict[str, float]:
@@ -10,13 +10,35 @@ import numpy as np
 import h5py
 from pathlib import Path
 from typing import Dict, Tuple, Optional, List
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import re
 
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Fields below this size are cheaper to reduce with plain NumPy than to
+# dispatch to the threaded kernel
+_NUMBA_MIN_SIZE = 100_000
+
+# Raw-data chunk cache for HDF5 reads (h5py default is 1 MiB); the slot
+# count is a prime well above the number of chunks that fit
+_CHUNK_CACHE_BYTES = 16 * 1024 * 1024
+_CHUNK_CACHE_SLOTS = 521
+
 
 class FieldAnalyzer:
     """Analyzes scalar fields from IBAMR simulation output"""
 
-    def __init__(self, results_dir: str):
+    def __init__(self, results_dir: str, dtype: Optional[np.dtype] = None):
         """
         Initialize field analyzer.
 
@@ -24,11 +46,24 @@ class FieldAnalyzer:
         -----------
         results_dir : str
             Path to test results directory
+        dtype : np.dtype, optional
+            dtype that loaded fields are converted to while reading (e.g.
+            np.float32 to halve memory and bandwidth); default keeps the
+            dtype stored in the file
         """
         self.results_dir = Path(results_dir)
+        self.dtype = dtype
         self.raw_dir = self.results_dir / 'raw'
         self.fields = {}
         self.grid_info = {}
+        # Dataset path where each variable was last found; files of a
+        # sweep share their layout, so this is tried first
+        self._variable_paths = {}
+        # Read buffers keyed by (shape, dtype) for load_field(reuse_buffer=True)
+        self._buffers = {}
+        # filename -> (mtime_ns, grid info), so unchanged files are opened
+        # only once
+        self._grid_info_cache = {}
 
     def discover_fields(self) -> List[str]:
         """
@@ -41,7 +76,47 @@ class FieldAnalyzer:
         h5_files = list(self.raw_dir.glob('*.h5'))
         return [f.name for f in h5_files]
 
-    def load_field(self, filename: str, variable: str = 'C') -> np.ndarray:
+    def index_all(self, max_workers: int = 8) -> Dict[str, Dict]:
+        """
+        Extract grid information from every field file concurrently.
+
+        Parameters:
+        -----------
+        max_workers : int
+            Number of threads opening files in parallel
+
+        Returns:
+        --------
+        dict : Filename -> grid information
+        """
+        filenames = self.discover_fields()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(filenames, executor.map(self.extract_grid_info, filenames)))
+
+    def load_many(self, filenames: List[str], variable: str = 'C',
+                  max_workers: int = 8) -> Dict[str, np.ndarray]:
+        """
+        Load the same variable from several files concurrently.
+
+        Parameters:
+        -----------
+        filenames : list of str
+            HDF5 filenames
+        variable : str
+            Variable name to load (default: 'C' for concentration)
+        max_workers : int
+            Number of threads reading files in parallel
+
+        Returns:
+        --------
+        dict : Filename -> scalar field data
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fields = executor.map(lambda name: self.load_field(name, variable), filenames)
+            return dict(zip(filenames, fields))
+
+    def load_field(self, filename: str, variable: str = 'C',
+                   reuse_buffer: bool = False) -> np.ndarray:
         """
         Load a scalar field from HDF5 file.
 
@@ -51,6 +126,12 @@ class FieldAnalyzer:
             HDF5 filename
         variable : str
             Variable name to load (default: 'C' for concentration)
+        reuse_buffer : bool
+            Read into a buffer owned by the analyzer instead of a new array.
+            The returned array is overwritten by the next reuse_buffer load
+            of the same shape and dtype and is not kept in self.fields;
+            copy it if it must outlive that. Intended for loops over many
+            timesteps that reduce each field before loading the next.
 
         Returns:
         --------
@@ -61,35 +142,48 @@ class FieldAnalyzer:
         if not filepath.exists():
             raise FileNotFoundError(f"Field file not found: {filepath}")
 
-        with h5py.File(filepath, 'r') as f:
-            # Try to find the variable
-            # IBAMR/VisIt output structure can vary
-            if variable in f:
-                data = f[variable][:]
-            elif f'/{variable}' in f:
-                data = f[f'/{variable}'][:]
-            else:
-                # Try to find it in common locations
-                possible_paths = [
-                    f'level_0/{variable}',
-                    f'processor_0/{variable}',
-                    f'patches/patch_0/{variable}',
-                ]
-                for path in possible_paths:
-                    if path in f:
-                        data = f[path][:]
-                        break
-                else:
-                    # List available datasets
-                    available = self._list_datasets(f)
-                    raise KeyError(
-                        f"Variable '{variable}' not found in {filename}. "
-                        f"Available: {available}"
-                    )
+        with h5py.File(filepath, 'r', rdcc_nbytes=_CHUNK_CACHE_BYTES,
+                       rdcc_nslots=_CHUNK_CACHE_SLOTS) as f:
+            path = self._resolve_variable(f, variable)
+            if path is None:
+                # List available datasets
+                available = self._list_datasets(f)
+                raise KeyError(
+                    f"Variable '{variable}' not found in {filename}. "
+                    f"Available: {available}"
+                )
+            dataset = f[path]
+            # HDF5 converts during the read, so no separate astype copy
+            dtype = dataset.dtype if self.dtype is None else np.dtype(self.dtype)
+            if reuse_buffer:
+                key = (dataset.shape, dtype)
+                if key not in self._buffers:
+                    self._buffers[key] = np.empty(dataset.shape, dtype=dtype)
+                return _read_dataset(dataset, out=self._buffers[key])
+            data = _read_dataset(dataset, out=np.empty(dataset.shape, dtype=dtype))
 
         self.fields[filename] = data
         return data
 
+    def _resolve_variable(self, f: h5py.File, variable: str) -> Optional[str]:
+        """Find the dataset path holding a variable, or None"""
+        # IBAMR/VisIt output structure can vary
+        candidates = [
+            variable,
+            f'level_0/{variable}',
+            f'processor_0/{variable}',
+            f'patches/patch_0/{variable}',
+        ]
+        last_path = self._variable_paths.get(variable)
+        if last_path is not None:
+            candidates.insert(0, last_path)
+
+        for path in candidates:
+            if path in f and isinstance(f[path], h5py.Dataset):
+                self._variable_paths[variable] = path
+                return path
+        return None
+
     def _list_datasets(self, h5_group, prefix='') -> List[str]:
         """Recursively list all datasets in HDF5 file"""
         datasets = []
@@ -117,6 +211,12 @@ class FieldAnalyzer:
         """
         filepath = self.raw_dir / filename
 
+        mtime = filepath.stat().st_mtime_ns
+        cached_mtime, cached = self._grid_info_cache.get(filename, (None, None))
+        if cached_mtime == mtime:
+            self.grid_info[filename] = cached
+            return cached
+
         with h5py.File(filepath, 'r') as f:
             grid_info = {}
 
@@ -131,6 +231,7 @@ class FieldAnalyzer:
 
             # Store for later use
             self.grid_info[filename] = grid_info
+            self._grid_info_cache[filename] = (mtime, grid_info)
 
         return grid_info
 
@@ -138,6 +239,9 @@ class FieldAnalyzer:
         """
         Compute basic statistics for a scalar field.
 
+        The field is reduced in its own dtype (float32 fields are not
+        copied to float64); sums are accumulated in double precision.
+
         Parameters:
         -----------
         field : np.ndarray
@@ -147,14 +251,15 @@ class FieldAnalyzer:
         --------
         dict : Field statistics
         """
+        moments = _moment_statistics(field)
         stats = {
-            'min': float(np.min(field)),
-            'max': float(np.max(field)),
-            'mean': float(np.mean(field)),
+            'min': moments['min'],
+            'max': moments['max'],
+            'mean': moments['mean'],
             'median': float(np.median(field)),
-            'std': float(np.std(field)),
-            'var': float(np.var(field)),
-            'sum': float(np.sum(field)),
+            'std': moments['std'],
+            'var': moments['var'],
+            'sum': moments['sum'],
             'shape': field.shape,
             'size': field.size,
         }
@@ -164,10 +269,22 @@ class FieldAnalyzer:
 
 def load_scalar_field(filepath: str,
                      variable: str = 'C',
-                     timestep: Optional[int] = None) -> np.ndarray:
+                     timestep: Optional[int] = None,
+                     lazy: bool = False) -> np.ndarray:
     """
     Load a scalar field from file.
 
+    Results are cached on (path, variable, timestep, modification time),
+    so repeated loads of an unchanged file skip the disk read. The
+    returned array is shared with the cache and therefore read-only;
+    copy it before modifying. Use ``load_scalar_field.cache_clear()`` to
+    drop all cached fields.
+
+    With ``lazy=True`` the HDF5 dataset is memory-mapped instead of read,
+    so fields larger than RAM can be analyzed through the page cache.
+    This requires a contiguous, uncompressed dataset and bypasses the
+    cache.
+
     Parameters:
     -----------
     filepath : str
@@ -176,58 +293,147 @@ def load_scalar_field(filepath: str,
         Variable name to load
     timestep : int, optional
         Specific timestep to load
+    lazy : bool
+        Return a read-only np.memmap instead of loading into memory
+        (HDF5 only)
 
     Returns:
     --------
     np.ndarray : Scalar field data
     """
+    filepath = Path(filepath).resolve()
+
+    if lazy:
+        if filepath.suffix != '.h5':
+            raise ValueError(f"Lazy loading is only supported for HDF5 files, got {filepath.suffix}")
+        return _map_hdf5_field(filepath, variable, timestep)
+
+    mtime = filepath.stat().st_mtime_ns
+    return _load_scalar_field_cached(str(filepath), variable, timestep, mtime)
+
+
+@lru_cache(maxsize=32)
+def _load_scalar_field_cached(filepath: str,
+                              variable: str,
+                              timestep: Optional[int],
+                              mtime: int) -> np.ndarray:
+    """Cached loader behind load_scalar_field (mtime only keys the cache)"""
     filepath = Path(filepath)
 
     if filepath.suffix == '.h5':
-        return _load_hdf5_field(filepath, variable, timestep)
+        data = _load_hdf5_field(filepath, variable, timestep)
     elif filepath.suffix == '.csv':
-        return _load_csv_field(filepath)
+        data = _load_csv_field(filepath)
     elif filepath.suffix == '.dat':
-        return _load_dat_field(filepath)
+        data = _load_dat_field(filepath)
     else:
         raise ValueError(f"Unsupported file format: {filepath.suffix}")
 
+    data.flags.writeable = False
+    return data
+
+
+load_scalar_field.cache_clear = _load_scalar_field_cached.cache_clear
+
 
 def _load_hdf5_field(filepath: Path,
                     variable: str,
                     timestep: Optional[int]) -> np.ndarray:
     """Load field from HDF5 file"""
-    with h5py.File(filepath, 'r') as f:
+    with h5py.File(filepath, 'r', rdcc_nbytes=_CHUNK_CACHE_BYTES,
+                   rdcc_nslots=_CHUNK_CACHE_SLOTS) as f:
         # Try various common paths
-        paths_to_try = [
-            variable,
-            f'/{variable}',
-            f'level_0/{variable}',
-            f'processor_0/{variable}',
-        ]
-
-        for path in paths_to_try:
+        for path in _hdf5_variable_paths(variable):
             if path in f:
-                data = f[path][:]
-                if timestep is not None and len(data.shape) > 0:
-                    # If data has time dimension, extract specific timestep
-                    if data.shape[0] > timestep:
-                        return data[timestep]
-                return data
+                dataset = f[path]
+                if timestep is not None and len(dataset.shape) > 0:
+                    # If data has time dimension, read only that timestep
+                    if dataset.shape[0] > timestep:
+                        return _read_dataset(dataset, timestep)
+                return _read_dataset(dataset)
 
         raise KeyError(f"Variable '{variable}' not found in {filepath}")
 
 
+def _hdf5_variable_paths(variable: str) -> List[str]:
+    """Common locations of a variable in IBAMR HDF5 output"""
+    return [
+        variable,
+        f'/{variable}',
+        f'level_0/{variable}',
+        f'processor_0/{variable}',
+    ]
+
+
+def _map_hdf5_field(filepath: Path,
+                    variable: str,
+                    timestep: Optional[int]) -> np.ndarray:
+    """Memory-map a contiguous HDF5 dataset without reading it"""
+    with h5py.File(filepath, 'r') as f:
+        for path in _hdf5_variable_paths(variable):
+            if path in f:
+                dataset = f[path]
+                # Only contiguous, unfiltered datasets have a byte offset
+                offset = dataset.id.get_offset()
+                if offset is None:
+                    raise ValueError(
+                        f"Variable '{variable}' in {filepath} is chunked or "
+                        f"compressed and cannot be memory-mapped"
+                    )
+                shape, dtype = dataset.shape, dataset.dtype
+                break
+        else:
+            raise KeyError(f"Variable '{variable}' not found in {filepath}")
+
+    data = np.memmap(filepath, dtype=dtype, mode='r', offset=offset, shape=shape)
+    if timestep is not None and len(shape) > 0 and shape[0] > timestep:
+        return data[timestep]
+    return data
+
+
+def _read_dataset(dataset: h5py.Dataset,
+                  index: Optional[int] = None,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Read an HDF5 dataset (or one index along its first axis) straight
+    into a preallocated array, avoiding h5py's intermediate copy. A
+    C-contiguous out array of the right shape is filled if given.
+    """
+    if index is None:
+        if out is None:
+            out = np.empty(dataset.shape, dtype=dataset.dtype)
+        if out.size:
+            dataset.read_direct(out)
+    else:
+        if out is None:
+            out = np.empty(dataset.shape[1:], dtype=dataset.dtype)
+        if out.size:
+            dataset.read_direct(out, source_sel=np.s_[index])
+    return out
+
+
 def _load_csv_field(filepath: Path) -> np.ndarray:
     """Load field from CSV file"""
+    if pd is not None:
+        return _read_table(filepath, sep=',')
     return np.loadtxt(filepath, delimiter=',')
 
 
 def _load_dat_field(filepath: Path) -> np.ndarray:
     """Load field from DAT file"""
+    if pd is not None:
+        return _read_table(filepath, sep=r'\s+')
     return np.loadtxt(filepath)
 
 
+def _read_table(filepath: Path, sep: str) -> np.ndarray:
+    """Parse a numeric text table with pandas' C parser"""
+    data = pd.read_csv(filepath, sep=sep, header=None, comment='#',
+                       dtype=np.float64, engine='c').to_numpy()
+    # Match np.loadtxt, which squeezes single rows/columns
+    return np.squeeze(data)
+
+
 def compute_field_difference(field1: np.ndarray,
                             field2: np.ndarray) -> np.ndarray:
     """
@@ -259,22 +465,84 @@ def compute_field_statistics(field: np.ndarray) -> Dict[str, float]:
     --------
     dict : Field statistics
     """
+    moments = _moment_statistics(field)
+
+    # One partition for all order statistics instead of one per percentile
+    p05, p25, median, p75, p95 = np.quantile(field, [0.05, 0.25, 0.5, 0.75, 0.95])
+
     stats = {
+        'min': moments['min'],
+        'max': moments['max'],
+        'mean': moments['mean'],
+        'median': float(median),
+        'std': moments['std'],
+        'var': moments['var'],
+        'sum': moments['sum'],
+        'integral': moments['sum'],  # Simplified - should include dx*dy*dz
+        'percentile_05': float(p05),
+        'percentile_25': float(p25),
+        'percentile_75': float(p75),
+        'percentile_95': float(p95),
+    }
+
+    return stats
+
+
+def _moment_statistics(field: np.ndarray) -> Dict[str, float]:
+    """
+    min, max, sum, mean, var and std of a field, read in its native dtype
+    with float64 accumulation
+    """
+    if _HAVE_NUMBA and field.size >= _NUMBA_MIN_SIZE:
+        flat = np.ascontiguousarray(field).ravel()
+        minimum, maximum, total = _min_max_sum(flat)
+        # NaN/Inf: let NumPy apply its own propagation rules
+        if np.isfinite(total):
+            mean = total / flat.size
+            var = _sum_squared_deviation(flat, mean) / flat.size
+            return {
+                'min': float(minimum),
+                'max': float(maximum),
+                'mean': float(mean),
+                'std': float(np.sqrt(var)),
+                'var': float(var),
+                'sum': float(total),
+            }
+
+    # Double-precision accumulators, matching the Numba kernels
+    mean = np.mean(field, dtype=np.float64)
+    var = np.var(field, dtype=np.float64)
+    return {
         'min': float(np.min(field)),
         'max': float(np.max(field)),
-        'mean': float(np.mean(field)),
-        'median': float(np.median(field)),
-        'std': float(np.std(field)),
-        'var': float(np.var(field)),
-        'sum': float(np.sum(field)),
-        'integral': float(np.sum(field)),  # Simplified - should include dx*dy*dz
-        'percentile_05': float(np.percentile(field, 5)),
-        'percentile_25': float(np.percentile(field, 25)),
-        'percentile_75': float(np.percentile(field, 75)),
-        'percentile_95': float(np.percentile(field, 95)),
+        'mean': float(mean),
+        'std': float(np.sqrt(var)),
+        'var': float(var),
+        'sum': float(np.sum(field, dtype=np.float64)),
     }
 
-    return stats
+
+if _HAVE_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _min_max_sum(values):
+        """Minimum, maximum and sum of a flat array in one pass"""
+        minimum = np.inf
+        maximum = -np.inf
+        total = 0.0
+        for i in prange(values.size):
+            minimum = min(minimum, values[i])
+            maximum = max(maximum, values[i])
+            total += values[i]
+        return minimum, maximum, total
+
+    @njit(cache=True, parallel=True)
+    def _sum_squared_deviation(values, mean):
+        """Sum of (x - mean)^2; a second pass keeps the variance stable"""
+        total = 0.0
+        for i in prange(values.size):
+            d = values[i] - mean
+            total += d * d
+        return total
 
 
 def extract_slice_2d(field: np.ndarray,
@@ -294,20 +562,44 @@ def extract_slice_2d(field: np.ndarray,
 
     Returns:
     --------
-    np.ndarray : 2D slice
+    np.ndarray : 2D slice (a view of field)
     """
+    return field[_slice_index(field, axis, index)]
+
+
+def extract_slices_2d(field: np.ndarray,
+                      axis: int,
+                      indices: np.ndarray) -> np.ndarray:
+    """
+    Extract several 2D slices from a 3D field in one indexing operation.
+
+    Parameters:
+    -----------
+    field : np.ndarray
+        3D scalar field
+    axis : int
+        Axis to slice (0=x, 1=y, 2=z)
+    indices : array-like of int
+        Indices along axis
+
+    Returns:
+    --------
+    np.ndarray : Stack of 2D slices, shape (len(indices), ...); entry k
+        equals extract_slice_2d(field, axis, indices[k])
+    """
+    slices = field[_slice_index(field, axis, np.asarray(indices))]
+    return np.moveaxis(slices, axis, 0)
+
+
+def _slice_index(field: np.ndarray, axis: int, index) -> tuple:
+    """Index tuple selecting index along axis of a 3D field"""
     if field.ndim != 3:
         raise ValueError(f"Field must be 3D, got {field.ndim}D")
-
-    if axis == 0:
-        return field[index, :, :]
-    elif axis == 1:
-        return field[:, index, :]
-    elif axis == 2:
-        return field[:, :, index]
-    else:
+    if axis not in (0, 1, 2):
         raise ValueError(f"Invalid axis: {axis}")
 
+    return (slice(None),) * axis + (index,)
+
 
 def extract_centerline(field: np.ndarray,
                        axis: int) -> np.ndarray:
@@ -325,25 +617,46 @@ def extract_centerline(field: np.ndarray,
     --------
     np.ndarray : Centerline profile
     """
-    if field.ndim == 2:
-        center_idx = [s // 2 for s in field.shape]
-        if axis == 0:
-            return field[:, center_idx[1]]
-        elif axis == 1:
-            return field[center_idx[0], :]
-        else:
-            raise ValueError(f"Invalid axis for 2D field: {axis}")
+    return field[_centerline_index(field, axis)]
 
-    elif field.ndim == 3:
-        center_idx = [s // 2 for s in field.shape]
-        if axis == 0:
-            return field[:, center_idx[1], center_idx[2]]
-        elif axis == 1:
-            return field[center_idx[0], :, center_idx[2]]
-        elif axis == 2:
-            return field[center_idx[0], center_idx[1], :]
-        else:
-            raise ValueError(f"Invalid axis: {axis}")
 
-    else:
+def extract_centerlines_batch(fields: List[np.ndarray],
+                              axis: int) -> np.ndarray:
+    """
+    Extract the centerline profile of several same-shape fields.
+
+    Parameters:
+    -----------
+    fields : list of np.ndarray
+        Scalar fields (2D or 3D), all of the same shape
+    axis : int
+        Axis along which to extract (0=x, 1=y, 2=z)
+
+    Returns:
+    --------
+    np.ndarray : Profiles stacked along the first axis
+    """
+    if not fields:
+        raise ValueError("No fields given")
+
+    # The index is the same for every field; only the profiles are copied
+    index = _centerline_index(fields[0], axis)
+    for field in fields[1:]:
+        if field.shape != fields[0].shape:
+            raise ValueError(f"Field shapes differ: {fields[0].shape} vs {field.shape}")
+
+    return np.stack([field[index] for field in fields])
+
+
+def _centerline_index(field: np.ndarray, axis: int) -> tuple:
+    """Index tuple selecting the line through the field center along axis"""
+    if field.ndim not in (2, 3):
         raise ValueError(f"Unsupported field dimension: {field.ndim}")
+    if axis not in range(field.ndim):
+        if field.ndim == 2:
+            raise ValueError(f"Invalid axis for 2D field: {axis}")
+        raise ValueError(f"Invalid axis: {axis}")
+
+    index = [s // 2 for s in field.shape]
+    index[axis] = slice(None)
+    return tuple(index)
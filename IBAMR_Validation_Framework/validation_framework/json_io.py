@@ -0,0 +1,95 @@
+"""
+JSON Input/Output
+=================
+
+JSON file helpers shared by the test runner and the analysis scripts,
+using orjson when it is available.
+"""
+
+import json
+import math
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _has_non_finite(data) -> bool:
+    """Whether data holds a NaN or infinite float anywhere"""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    if isinstance(data, (np.ndarray, np.generic)):
+        # Checked in C, without converting the array to Python objects
+        if data.dtype.kind == 'f':
+            return not np.isfinite(data).all()
+        if data.dtype.kind == 'O':
+            return _has_non_finite(data.tolist())
+    return False
+
+
+def _to_builtin(obj):
+    """json.dump default: NumPy arrays and scalars as Python lists/numbers"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: bytes):
+    """
+    Parse JSON text, using orjson when it is available.
+
+    orjson rejects the NaN/Infinity literals that the standard library
+    writes for non-finite floats, so such documents fall back to json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def read_json(path):
+    """Read a JSON file (see loads)"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def write_json(path, data, pretty: bool = False):
+    """
+    Write data as JSON, using orjson when it is available.
+
+    orjson writes non-finite floats as null, so data holding NaN/inf is
+    written with the standard library instead, which keeps them as
+    NaN/Infinity literals that read back as floats.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Output file path
+    data : object
+        JSON-serializable data (NumPy arrays and scalars are converted)
+    pretty : bool
+        Indent the output; by default it is compact, since only
+        human-facing files are pretty-printed
+    """
+    if orjson is not None and not _has_non_finite(data):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+        return
+
+    with open(path, 'w') as f:
+        if pretty:
+            json.dump(data, f, indent=2, default=_to_builtin)
+        else:
+            json.dump(data, f, separators=(',', ':'), default=_to_builtin)
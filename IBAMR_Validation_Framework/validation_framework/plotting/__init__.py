@@ -9,49 +9,54 @@ Main components:
 - field_plots: Scalar field visualization (slices, contours)
 - convergence_plots: Convergence log-log plots
 - comparison_plots: Side-by-side field comparisons
+- batch: Parallel generation of many plots
+
+Every plot function takes a ``formats`` argument and by default writes
+both a PNG and a PDF next to ``output_path``; pass ``formats=('png',)``
+to skip the PDF.
 """
 
-from .error_plots import (
-    plot_error_vs_time,
-    plot_error_vs_resolution,
-    plot_error_comparison,
-    plot_error_statistics
-)
-
-from .field_plots import (
-    plot_scalar_field_2d,
-    plot_scalar_field_contour,
-    plot_field_slice,
-    plot_field_difference,
-    plot_centerline_profile
-)
-
-from .convergence_plots import (
-    plot_convergence_rate,
-    plot_eoc_table,
-    plot_richardson_extrapolation
-)
-
-from .comparison_plots import (
-    plot_field_comparison,
-    plot_multiple_fields,
-    plot_heatmap_comparison
-)
-
-__all__ = [
-    'plot_error_vs_time',
-    'plot_error_vs_resolution',
-    'plot_error_comparison',
-    'plot_error_statistics',
-    'plot_scalar_field_2d',
-    'plot_scalar_field_contour',
-    'plot_field_slice',
-    'plot_field_difference',
-    'plot_centerline_profile',
-    'plot_convergence_rate',
-    'plot_eoc_table',
-    'plot_richardson_extrapolation',
-    'plot_field_comparison',
-    'plot_multiple_fields',
-    'plot_heatmap_comparison',
-]
+from importlib import import_module
+
+# Public name -> submodule defining it. Submodules are imported on first
+# access (PEP 562), so importing one plotting module, e.g. convergence_plots,
+# does not load pyplot through the others.
+_EXPORTS = {
+    'plot_error_vs_time': 'error_plots',
+    'plot_error_vs_resolution': 'error_plots',
+    'plot_error_comparison': 'error_plots',
+    'plot_error_statistics': 'error_plots',
+    'plot_scalar_field_2d': 'field_plots',
+    'plot_scalar_field_contour': 'field_plots',
+    'plot_field_slice': 'field_plots',
+    'plot_field_difference': 'field_plots',
+    'plot_centerline_profile': 'field_plots',
+    'plot_convergence_rate': 'convergence_plots',
+    'plot_eoc_table': 'convergence_plots',
+    'plot_richardson_extrapolation': 'convergence_plots',
+    'plot_convergence_rates_batch': 'convergence_plots',
+    'reusable_axes': 'convergence_plots',
+    'plot_field_comparison': 'comparison_plots',
+    'plot_field_comparisons_batch': 'comparison_plots',
+    'plot_multiple_fields': 'comparison_plots',
+    'plot_heatmap_comparison': 'comparison_plots',
+    'generate_plots': 'batch',
+}
+
+
+def __getattr__(name):
+    """Import the submodule defining a public name on first access"""
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,51 @@
+"""
+Plot Display Arrays
+===================
+
+Preparing field arrays for imshow, shared by the plotting modules.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Smallest color range, relative to the largest magnitude, that float32 still
+# resolves into all 256 colormap levels (256 * float32 eps, with margin)
+FLOAT32_MIN_RELATIVE_RANGE = 1e-4
+
+# Longest axis drawn at full resolution; a 300 dpi figure has fewer pixels than this
+MAX_DISPLAY_DIM = 2048
+
+
+def downsample(field: np.ndarray, max_dim: Optional[int]) -> Tuple[np.ndarray, int]:
+    """Strided view of a 2D field with no axis longer than max_dim, and the stride"""
+    if max_dim is None or max(field.shape) <= max_dim:
+        return field, 1
+    stride = -(-max(field.shape) // max_dim)
+    return field[::stride, ::stride], stride
+
+
+def image_extent(shape: Tuple[int, int]) -> Tuple[float, float, float, float]:
+    """imshow extent of a transposed field, in grid indices of the full field"""
+    return (-0.5, shape[0] - 0.5, -0.5, shape[1] - 0.5)
+
+
+def display_array(field: np.ndarray,
+                  dtype=np.float32,
+                  vmin: Optional[float] = None,
+                  vmax: Optional[float] = None,
+                  max_dim: Optional[int] = None) -> np.ndarray:
+    """
+    Contiguous transposed copy of a 2D field for imshow, cast to the display
+    dtype and strided down to max_dim. Narrowing a float field is skipped when
+    its color range is too small for the narrower type to resolve.
+    """
+    field, _ = downsample(field, max_dim)
+    dtype = field.dtype if dtype is None else np.dtype(dtype)
+    if field.dtype.kind == 'f' and dtype.itemsize < field.dtype.itemsize:
+        lo = np.min(field) if vmin is None else vmin
+        hi = np.max(field) if vmax is None else vmax
+        scale = max(abs(lo), abs(hi))
+        if not hi - lo > FLOAT32_MIN_RELATIVE_RANGE * scale:
+            dtype = field.dtype
+    return np.ascontiguousarray(field.T, dtype=dtype)
@@ -0,0 +1,65 @@
+"""
+Plot Output
+===========
+
+File output helpers shared by the plotting modules.
+"""
+
+import io
+from pathlib import Path
+from typing import Optional, Sequence
+
+
+def write_png(fig, path, **savefig_kwargs):
+    """
+    Render the figure to PNG in memory and write it to path in a single call.
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+        Figure to save
+    path : str or Path
+        Output file path
+    **savefig_kwargs
+        Passed through to fig.savefig (dpi, bbox_inches, ...)
+    """
+    # The encoder writes many small chunks; on network filesystems it is much
+    # cheaper to collect them in memory and hand the file one large write.
+    # A buffered file is used because its write() loops over short writes.
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', **savefig_kwargs)
+    with open(path, 'wb') as f:
+        f.write(buf.getbuffer())
+
+
+def save_figure(fig, output_path, formats: Sequence[str],
+                bbox_inches: Optional[str] = None,
+                close: bool = True):
+    """
+    Save a figure once per requested format, then close it.
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+        Figure to save
+    output_path : str or Path
+        Output path; its suffix is replaced by each format
+    formats : sequence of str
+        File formats to write, e.g. ('png', 'pdf')
+    bbox_inches : str, optional
+        'tight' crops to the drawn artists at the cost of an extra draw per
+        file; by default the figure is saved as laid out by tight_layout
+    close : bool
+        Close the figure afterwards (False for caller-owned figures)
+    """
+    output_path = Path(output_path)
+    for fmt in formats:
+        fmt = fmt.lstrip('.').lower()
+        if fmt == 'png':
+            write_png(fig, output_path.with_suffix('.png'), bbox_inches=bbox_inches)
+        else:
+            fig.savefig(output_path.with_suffix('.' + fmt), bbox_inches=bbox_inches)
+    if close:
+        # Imported here so that importing this module does not load pyplot
+        import matplotlib.pyplot as plt
+        plt.close(fig)
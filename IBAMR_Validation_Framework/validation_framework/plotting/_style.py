@@ -0,0 +1,23 @@
+"""
+Plot Style
+==========
+
+Shared matplotlib style for the plotting modules.
+"""
+
+from pathlib import Path
+
+import matplotlib
+
+STYLE_PATH = Path(__file__).with_name('validation.mplstyle')
+
+# Parsed once at import; each plot call only swaps these values in and out
+_STYLE = matplotlib.rc_params_from_file(STYLE_PATH, use_default_template=False)
+
+
+def validation_style():
+    """
+    Context manager (also usable as a decorator) that applies the validation
+    plot style and restores the caller's rcParams afterwards.
+    """
+    return matplotlib.rc_context(_STYLE)
@@ -0,0 +1,47 @@
+"""
+Batch Plotting
+==============
+
+Run independent plot functions in parallel worker processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+PlotJob = Tuple[Callable, Sequence, Dict[str, Any]]
+
+
+def _run_plot_job(job: PlotJob):
+    """Worker entry point for generate_plots"""
+    fn, args, kwargs = job
+    return fn(*args, **kwargs)
+
+
+def generate_plots(jobs: Sequence[PlotJob],
+                   max_workers: Optional[int] = None) -> List:
+    """
+    Run many plot functions in parallel worker processes.
+
+    Each plot_* function only reads its arguments and writes its own files,
+    so whole figures are farmed out to separate processes (each with its own
+    pyplot state and Agg backend).
+
+    Parameters:
+    -----------
+    jobs : sequence of (function, args, kwargs) tuples
+        Plot calls to make. The function must be importable at module level
+        (e.g. plot_error_vs_time) and its arguments picklable.
+    max_workers : int, optional
+        Number of worker processes (default: cpu_count)
+
+    Returns:
+    --------
+    results : list
+        Return values in the order of ``jobs``
+    """
+    jobs = list(jobs)
+    if len(jobs) <= 1 or max_workers == 1:
+        return [_run_plot_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run_plot_job, jobs))
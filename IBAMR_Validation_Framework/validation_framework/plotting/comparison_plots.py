@@ -5,21 +5,26 @@ Comparison Plotting Module
 Tools for comparing fields and results across tests.
 """
 
-import matplotlib.pyplot as plt
 import matplotlib
-matplotlib.use('Agg')
+matplotlib.use('Agg', force=False)
+import matplotlib.pyplot as plt
 import numpy as np
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Sequence
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 300
+from ._display import display_array
+from ._io import save_figure
+from .batch import generate_plots
+from ._style import validation_style
 
 
+@validation_style()
 def plot_field_comparison(computed: np.ndarray,
                           exact: np.ndarray,
                           output_path: str,
-                          title: str = "Field Comparison"):
+                          title: str = "Field Comparison",
+                          formats: Sequence[str] = ('png', 'pdf')):
     """
     Side-by-side comparison of computed vs exact fields.
 
@@ -31,6 +36,8 @@ def plot_field_comparison(computed: np.ndarray,
         Path to save figure
     title : str
         Plot title
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
     """
     if computed.shape != exact.shape:
         raise ValueError("Fields must have same shape")
@@ -45,19 +52,23 @@ def plot_field_comparison(computed: np.ndarray,
     vmax = max(np.max(computed), np.max(exact))
 
     # Computed field
-    im1 = axes[0].imshow(computed.T, origin='lower', aspect='auto',
+    im1 = axes[0].imshow(display_array(computed, vmin=vmin, vmax=vmax),
+                        origin='lower', aspect='auto',
                         vmin=vmin, vmax=vmax, cmap='viridis')
     axes[0].set_title('Computed', fontweight='bold')
     plt.colorbar(im1, ax=axes[0])
 
     # Exact field
-    im2 = axes[1].imshow(exact.T, origin='lower', aspect='auto',
+    im2 = axes[1].imshow(display_array(exact, vmin=vmin, vmax=vmax),
+                        origin='lower', aspect='auto',
                         vmin=vmin, vmax=vmax, cmap='viridis')
     axes[1].set_title('Exact', fontweight='bold')
     plt.colorbar(im2, ax=axes[1])
 
     # Difference
-    diff = np.abs(computed - exact)
+    diff = np.empty(computed.shape, dtype=np.result_type(computed, exact))
+    np.subtract(computed, exact, out=diff)
+    np.abs(diff, out=diff)
     im3 = axes[2].imshow(diff.T, origin='lower', aspect='auto', cmap='hot')
     axes[2].set_title('Absolute Difference', fontweight='bold')
     plt.colorbar(im3, ax=axes[2])
@@ -65,17 +76,52 @@ def plot_field_comparison(computed: np.ndarray,
     plt.suptitle(title, fontweight='bold', fontsize=16, y=0.98)
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats, bbox_inches='tight')
+
+
+def _plot_field_comparison_job(job: Dict):
+    """Worker entry point for plot_field_comparisons_batch"""
+    plot_field_comparison(**job)
+    return job['output_path']
+
+
+def plot_field_comparisons_batch(comparisons: List[Dict],
+                                 max_workers: Optional[int] = None,
+                                 formats: Sequence[str] = ('png', 'pdf')) -> List[str]:
+    """
+    Render many field comparisons in parallel worker processes.
 
+    pyplot keeps global state and Agg rendering holds the GIL, so sweeps are
+    parallelized across figures (one process per figure) rather than across
+    the panels of a single figure.
 
+    Parameters:
+    -----------
+    comparisons : list of dict
+        Keyword arguments for plot_field_comparison, one dict per figure
+        (computed, exact, output_path and optionally title)
+    max_workers : int, optional
+        Number of worker processes (default: cpu_count)
+    formats : sequence of str
+        File formats to write, unless overridden per comparison
+
+    Returns:
+    --------
+    output_paths : list
+        Output paths in the order of ``comparisons``
+    """
+    jobs = [(_plot_field_comparison_job, ({'formats': formats, **comparison},), {})
+            for comparison in comparisons]
+    return generate_plots(jobs, max_workers=max_workers)
+
+
+@validation_style()
 def plot_multiple_fields(fields: List[Tuple[np.ndarray, str]],
                         output_path: str,
                         title: str = "Field Comparison",
                         cmap: str = 'viridis',
-                        same_scale: bool = True):
+                        same_scale: bool = True,
+                        formats: Sequence[str] = ('png', 'pdf')):
     """
     Plot multiple fields for comparison.
 
@@ -91,6 +137,8 @@ def plot_multiple_fields(fields: List[Tuple[np.ndarray, str]],
         Colormap
     same_scale : bool
         Use same color scale for all
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
     """
     n = len(fields)
     ncols = min(4, n)
@@ -103,14 +151,17 @@ def plot_multiple_fields(fields: List[Tuple[np.ndarray, str]],
     axes = axes.flatten()
 
     if same_scale:
-        all_fields = [f[0] for f in fields]
-        vmin = min(np.min(f) for f in all_fields)
-        vmax = max(np.max(f) for f in all_fields)
+        # One (min, max) pair per field, reduced together; concatenating the
+        # fields instead would copy every one of them
+        extrema = np.array([(np.min(f[0]), np.max(f[0])) for f in fields])
+        vmin = extrema[:, 0].min()
+        vmax = extrema[:, 1].max()
     else:
         vmin, vmax = None, None
 
     for i, (field, label) in enumerate(fields):
-        im = axes[i].imshow(field.T, origin='lower', aspect='auto',
+        im = axes[i].imshow(display_array(field, vmin=vmin, vmax=vmax),
+                          origin='lower', aspect='auto',
                           cmap=cmap, vmin=vmin, vmax=vmax)
         axes[i].set_title(label, fontweight='bold')
         plt.colorbar(im, ax=axes[i])
@@ -122,17 +173,16 @@ def plot_multiple_fields(fields: List[Tuple[np.ndarray, str]],
     plt.suptitle(title, fontweight='bold', fontsize=16, y=0.995)
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats, bbox_inches='tight')
 
 
+@validation_style()
 def plot_heatmap_comparison(data_dict: Dict[str, float],
                            output_path: str,
                            title: str = "Test Results Heatmap",
                            vmin: Optional[float] = None,
-                           vmax: Optional[float] = None):
+                           vmax: Optional[float] = None,
+                           formats: Sequence[str] = ('png', 'pdf')):
     """
     Create heatmap comparing results across multiple tests/metrics.
 
@@ -146,15 +196,29 @@ def plot_heatmap_comparison(data_dict: Dict[str, float],
         Plot title
     vmin, vmax : float, optional
         Color scale limits
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
     """
     # Convert to matrix
     test_names = list(data_dict.keys())
     metric_names = list(data_dict[test_names[0]].keys())
 
-    matrix = np.zeros((len(test_names), len(metric_names)))
-    for i, test in enumerate(test_names):
-        for j, metric in enumerate(metric_names):
-            matrix[i, j] = data_dict[test].get(metric, 0)
+    # Rows with every metric are extracted in one itemgetter call; only
+    # incomplete rows fall back to per-metric lookups with a default of 0
+    if len(metric_names) == 1:
+        # itemgetter with a single key returns a bare value, not a tuple
+        metric, = metric_names
+        get_row = lambda values: (values[metric],)
+    else:
+        get_row = itemgetter(*metric_names)
+    rows = []
+    for test in test_names:
+        values = data_dict[test]
+        try:
+            rows.append(get_row(values))
+        except KeyError:
+            rows.append([values.get(metric, 0) for metric in metric_names])
+    matrix = np.array(rows, dtype=float)
 
     fig, ax = plt.subplots(figsize=(12, max(6, len(test_names) * 0.5)))
 
@@ -179,15 +243,14 @@ def plot_heatmap_comparison(data_dict: Dict[str, float],
     ax.set_title(title, fontweight='bold', fontsize=14, pad=20)
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats, bbox_inches='tight')
 
 
+@validation_style()
 def plot_test_summary(test_results: Dict[str, Dict],
                      output_path: str,
-                     title: str = "Test Suite Summary"):
+                     title: str = "Test Suite Summary",
+                     formats: Sequence[str] = ('png', 'pdf')):
     """
     Create comprehensive summary visualization.
 
@@ -199,17 +262,19 @@ def plot_test_summary(test_results: Dict[str, Dict],
         Path to save figure
     title : str
         Plot title
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
     """
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
 
     test_names = list(test_results.keys())
     n_tests = len(test_names)
 
-    # Extract common metrics
-    l2_errors = [test_results[t].get('L2', 0) for t in test_names]
-    linf_errors = [test_results[t].get('Linf', 0) for t in test_names]
-    mass_errors = [test_results[t].get('mass_error', 0) for t in test_names]
-    convergence_rates = [test_results[t].get('convergence_rate', 0) for t in test_names]
+    # Extract common metrics in one pass over the results (missing -> 0)
+    rows = [(r.get('L2', 0), r.get('Linf', 0), r.get('mass_error', 0),
+             r.get('convergence_rate', 0)) for r in test_results.values()]
+    l2_errors, linf_errors, mass_errors, convergence_rates = (
+        list(zip(*rows)) or [(), (), (), ()])
 
     x = np.arange(n_tests)
 
@@ -254,7 +319,4 @@ def plot_test_summary(test_results: Dict[str, Dict],
     plt.suptitle(title, fontweight='bold', fontsize=16, y=0.995)
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats, bbox_inches='tight')
@@ -5,24 +5,88 @@ Convergence Plotting Module
 Visualization tools for convergence analysis.
 """
 
-import matplotlib.pyplot as plt
 import matplotlib
-matplotlib.use('Agg')
+matplotlib.use('Agg', force=False)
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 300
+from ._io import save_figure
+from ._style import validation_style
+from .batch import generate_plots
 
 
+@lru_cache(maxsize=None)
+def _plt():
+    """Import pyplot on first use so importing this module stays cheap"""
+    import matplotlib.pyplot as plt
+    return plt
+
+
+# Orders of the reference lines drawn on convergence plots
+_REFERENCE_ORDERS = np.array([1.0, 2.0])
+
+# Marker cycle for multi-test plots
+_MARKERS = ('o', 's', '^', 'v', 'D', '*', 'p', 'h')
+
+
+@lru_cache(maxsize=32)
+def _tab10(n: int) -> np.ndarray:
+    """RGBA colours for n series sampled evenly from tab10 (read-only)"""
+    colors = matplotlib.colormaps['tab10'](np.linspace(0, 1, n))
+    colors.flags.writeable = False
+    return colors
+
+
+def _prepare_axes(ax, **subplots_kwargs):
+    """Return (fig, ax), clearing a caller-supplied ax or making a new figure"""
+    if ax is None:
+        return _plt().subplots(**subplots_kwargs)
+    axes = np.atleast_1d(ax)
+    for a in axes:
+        a.clear()
+    return axes[0].figure, ax
+
+
+@contextmanager
+def reusable_axes(figsize=(10, 8), **subplots_kwargs):
+    """
+    Create one styled figure to be reused by several convergence plots.
+
+    Figure construction and teardown dominate the cost of small plots, so
+    batch callers can pass the yielded axes as ``ax=`` to each plot call;
+    every call clears the axes before drawing. The figure is closed on exit.
+
+    Parameters:
+    -----------
+    figsize : tuple
+        Figure size in inches
+    **subplots_kwargs
+        Passed through to plt.subplots (e.g. ncols=2 for plot_eoc_table)
+    """
+    plt = _plt()
+    with validation_style():
+        fig, ax = plt.subplots(figsize=figsize, **subplots_kwargs)
+    try:
+        yield ax
+    finally:
+        plt.close(fig)
+
+
+@validation_style()
 def plot_convergence_rate(resolutions: List[float],
                           errors: List[float],
                           output_path: str,
                           convergence_rate: float,
                           title: str = "Convergence Analysis",
                           error_label: str = "Error",
-                          expected_order: Optional[float] = None):
+                          expected_order: Optional[float] = None,
+                          formats: Sequence[str] = ('png', 'pdf'),
+                          ax=None):
     """
     Plot convergence rate with fitted line.
 
@@ -42,22 +106,27 @@ def plot_convergence_rate(resolutions: List[float],
         Label for error type
     expected_order : float, optional
         Expected theoretical order
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
+    ax : matplotlib.axes.Axes, optional
+        Existing axes to draw into (cleared first, figure left open),
+        e.g. from reusable_axes()
     """
-    fig, ax = plt.subplots(figsize=(10, 8))
+    owns_figure = ax is None
+    fig, ax = _prepare_axes(ax, figsize=(10, 8))
 
     # Plot data points
     ax.loglog(resolutions, errors, 'bo', markersize=10, label='Computed',
              markeredgecolor='black', markeredgewidth=1.5, alpha=0.8)
 
     # Plot fitted line
-    h = np.array(resolutions)
-    # Compute fitted line: e = C * h^p
-    log_h = np.log(h)
-    log_e = np.log(np.array(errors))
+    h = np.asarray(resolutions, dtype=np.float64)
+    # Compute fitted line: e = C * h^p, with log C = mean(log e) - p * mean(log h)
     p = convergence_rate
-    C = np.exp(np.mean(log_e - p * log_h))
+    C = np.exp(np.mean(np.log(errors)) - p * np.mean(np.log(h)))
 
-    h_fit = np.logspace(np.log10(min(h)), np.log10(max(h)), 100)
+    h_min, h_max = float(h.min()), float(h.max())
+    h_fit = np.logspace(np.log10(h_min), np.log10(h_max), 100)
     e_fit = C * h_fit**p
 
     ax.loglog(h_fit, e_fit, 'b-', linewidth=2, alpha=0.6,
@@ -69,12 +138,11 @@ def plot_convergence_rate(resolutions: List[float],
         ax.loglog(h_fit, e_expected, 'r--', linewidth=2, alpha=0.6,
                  label=f'Expected: order = {expected_order:.2f}')
 
-    # Add reference lines
-    h_ref = np.array([min(h), max(h)])
-    for order, style, alpha in [(1, ':', 0.3), (2, ':', 0.3)]:
-        e_ref = errors[0] * (h_ref / h[0])**order
-        ax.loglog(h_ref, e_ref, 'k' + style, linewidth=1, alpha=alpha,
-                 label=f'Order {order}' if order <= 2 else None)
+    # Add reference lines, one column per order
+    h_ref = np.array([h_min, h_max])
+    e_refs = errors[0] * (h_ref[:, None] / h[0]) ** _REFERENCE_ORDERS
+    ax.loglog(h_ref, e_refs, 'k:', linewidth=1, alpha=0.3,
+             label=[f'Order {order:g}' for order in _REFERENCE_ORDERS])
 
     ax.set_xlabel('Grid Resolution h', fontweight='bold', fontsize=12)
     ax.set_ylabel(f'{error_label}', fontweight='bold', fontsize=12)
@@ -93,17 +161,53 @@ def plot_convergence_rate(resolutions: List[float],
     ax.text(0.05, 0.95, textstr, transform=ax.transAxes, fontsize=10,
            verticalalignment='top', bbox=props)
 
-    plt.tight_layout()
+    fig.tight_layout()
+
+    save_figure(fig, output_path, formats, bbox_inches='tight', close=owns_figure)
+
+
+def _plot_convergence_rate_job(job: Dict):
+    """Worker entry point for plot_convergence_rates_batch"""
+    plot_convergence_rate(**job)
+    return job['output_path']
+
+
+def plot_convergence_rates_batch(plots: List[Dict],
+                                 max_workers: Optional[int] = None,
+                                 formats: Sequence[str] = ('png', 'pdf')) -> List[str]:
+    """
+    Render the convergence-rate plots of many tests in parallel worker processes.
+
+    Each figure is independent and CPU-bound in Agg, so whole figures are
+    farmed out to separate processes (each imports this module and so runs
+    with the Agg backend).
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    Parameters:
+    -----------
+    plots : list of dict
+        Keyword arguments for plot_convergence_rate, one dict per test
+        (resolutions, errors, output_path, convergence_rate, ...)
+    max_workers : int, optional
+        Number of worker processes (default: cpu_count)
+    formats : sequence of str
+        File formats to write, unless overridden per plot
+
+    Returns:
+    --------
+    output_paths : list
+        Output paths in the order of ``plots``
+    """
+    jobs = [(_plot_convergence_rate_job, ({'formats': formats, **plot},), {})
+            for plot in plots]
+    return generate_plots(jobs, max_workers=max_workers)
 
 
+@validation_style()
 def plot_eoc_table(eoc_data: List[Dict],
                   output_path: str,
-                  title: str = "Experimental Order of Convergence"):
+                  title: str = "Experimental Order of Convergence",
+                  formats: Sequence[str] = ('png', 'pdf'),
+                  ax=None):
     """
     Visualize EOC table.
 
@@ -115,8 +219,14 @@ def plot_eoc_table(eoc_data: List[Dict],
         Path to save figure
     title : str
         Plot title
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
+    ax : pair of matplotlib.axes.Axes, optional
+        Existing (error, EOC) axes to draw into (cleared first, figure left
+        open), e.g. from reusable_axes(figsize=(14, 6), ncols=2)
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    owns_figure = ax is None
+    fig, (ax1, ax2) = _prepare_axes(ax, ncols=2, figsize=(14, 6))
 
     levels = [d['level'] for d in eoc_data]
     resolutions = [d['resolution'] for d in eoc_data]
@@ -149,20 +259,20 @@ def plot_eoc_table(eoc_data: List[Dict],
     ax2.legend(loc='best')
     ax2.grid(True, linestyle='--', alpha=0.3)
 
-    plt.suptitle(title, fontweight='bold', fontsize=14, y=0.98)
-    plt.tight_layout()
+    fig.suptitle(title, fontweight='bold', fontsize=14, y=0.98)
+    fig.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats, bbox_inches='tight', close=owns_figure)
 
 
+@validation_style()
 def plot_richardson_extrapolation(resolutions: List[float],
                                   solutions: List[float],
                                   extrapolated: float,
                                   output_path: str,
-                                  title: str = "Richardson Extrapolation"):
+                                  title: str = "Richardson Extrapolation",
+                                  formats: Sequence[str] = ('png', 'pdf'),
+                                  ax=None):
     """
     Visualize Richardson extrapolation.
 
@@ -178,12 +288,19 @@ def plot_richardson_extrapolation(resolutions: List[float],
         Path to save figure
     title : str
         Plot title
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
+    ax : matplotlib.axes.Axes, optional
+        Existing axes to draw into (cleared first, figure left open),
+        e.g. from reusable_axes()
     """
-    fig, ax = plt.subplots(figsize=(10, 7))
+    owns_figure = ax is None
+    fig, ax = _prepare_axes(ax, figsize=(10, 7))
 
     # Plot solutions vs 1/N (or h)
-    h = np.array(resolutions)
-    ax.plot(h, solutions, 'bo-', markersize=10, linewidth=2,
+    h = np.asarray(resolutions, dtype=np.float64)
+    u = np.asarray(solutions, dtype=np.float64)
+    ax.plot(h, u, 'bo-', markersize=10, linewidth=2,
            markeredgecolor='black', markeredgewidth=1.5, alpha=0.8,
            label='Computed Solutions')
 
@@ -191,13 +308,15 @@ def plot_richardson_extrapolation(resolutions: List[float],
     ax.axhline(y=extrapolated, color='r', linestyle='--', linewidth=2,
               alpha=0.7, label=f'Extrapolated: {extrapolated:.6f}')
 
-    # Fit and plot trend line
-    from scipy import stats
-    slope, intercept, r_value, p_value, std_err = stats.linregress(h, solutions)
-    h_fit = np.linspace(0, max(h), 100)
+    # Fit and plot trend line (least squares; only slope, intercept and R² needed)
+    slope, intercept = np.polyfit(h, u, 1)
+    ss_res = np.sum((u - (slope * h + intercept))**2)
+    ss_tot = np.sum((u - u.mean())**2)
+    r2 = 1.0 - ss_res / ss_tot if ss_tot > 0 else 1.0
+    h_fit = np.linspace(0, h.max(), 100)
     fit_line = slope * h_fit + intercept
     ax.plot(h_fit, fit_line, 'g:', linewidth=1.5, alpha=0.5,
-           label=f'Linear fit (R² = {r_value**2:.4f})')
+           label=f'Linear fit (R² = {r2:.4f})')
 
     ax.set_xlabel('Grid Resolution h', fontweight='bold')
     ax.set_ylabel('Solution Value', fontweight='bold')
@@ -214,17 +333,17 @@ def plot_richardson_extrapolation(resolutions: List[float],
     ax.text(0.95, 0.05, textstr, transform=ax.transAxes, fontsize=10,
            verticalalignment='bottom', horizontalalignment='right', bbox=props)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats, bbox_inches='tight', close=owns_figure)
 
 
+@validation_style()
 def plot_multi_convergence(convergence_data: Dict[str, Dict],
                           output_path: str,
-                          title: str = "Multi-Test Convergence Comparison"):
+                          title: str = "Multi-Test Convergence Comparison",
+                          formats: Sequence[str] = ('png', 'pdf'),
+                          ax=None):
     """
     Plot convergence for multiple tests/error types.
 
@@ -236,46 +355,69 @@ def plot_multi_convergence(convergence_data: Dict[str, Dict],
         Path to save figure
     title : str
         Plot title
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
+    ax : matplotlib.axes.Axes, optional
+        Existing axes to draw into (cleared first, figure left open),
+        e.g. from reusable_axes()
     """
-    fig, ax = plt.subplots(figsize=(12, 8))
-
-    markers = ['o', 's', '^', 'v', 'D', '*', 'p', 'h']
-    colors = plt.cm.tab10(np.linspace(0, 1, len(convergence_data)))
-
+    owns_figure = ax is None
+    fig, ax = _prepare_axes(ax, figsize=(12, 8))
+
+    colors = _tab10(len(convergence_data))
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+
+    # One (h, e) polyline per test
+    segments = [np.column_stack([np.asarray(data['resolutions'], dtype=np.float64),
+                                 np.asarray(data['errors'], dtype=np.float64)])
+                for data in convergence_data.values()]
+
+    # Draw all curves as a single collection, and the markers as one
+    # collection per marker shape, instead of one Line2D per test
+    ax.add_collection(LineCollection(segments, colors=colors, linewidths=2,
+                                     alpha=0.8))
+    for k, marker in enumerate(_MARKERS):
+        group = list(range(k, len(segments), len(_MARKERS)))
+        if not group:
+            break
+        points = np.concatenate([segments[i] for i in group])
+        point_colors = np.repeat(colors[group], [len(segments[i]) for i in group],
+                                 axis=0)
+        ax.scatter(points[:, 0], points[:, 1], s=8**2, marker=marker,
+                   c=point_colors, alpha=0.8, edgecolors='black', linewidths=1,
+                   zorder=3)
+    ax.autoscale_view()
+
+    # Legend entries are proxies; they are never drawn on the axes
+    handles = []
     for i, (test_name, data) in enumerate(convergence_data.items()):
-        h = data['resolutions']
-        e = data['errors']
         rate = data.get('rate', None)
 
-        marker = markers[i % len(markers)]
-        color = colors[i]
-
         label = test_name
         if rate is not None:
             label += f' (p={rate:.2f})'
 
-        ax.loglog(h, e, marker=marker, color=color, linewidth=2,
-                 markersize=8, label=label, alpha=0.8,
-                 markeredgecolor='black', markeredgewidth=1)
+        handles.append(Line2D([], [], marker=_MARKERS[i % len(_MARKERS)],
+                              color=colors[i], linewidth=2, markersize=8,
+                              label=label, alpha=0.8, markeredgecolor='black',
+                              markeredgewidth=1))
 
     # Add reference lines
-    h_range = [ax.get_xlim()[0], ax.get_xlim()[1]]
+    h_lo, h_hi = ax.get_xlim()
     e_ref = ax.get_ylim()[1]
-
-    for order in [1, 2]:
-        e_line = [e_ref, e_ref * (h_range[1]/h_range[0])**order]
-        ax.loglog(h_range, e_line, 'k:', alpha=0.3, linewidth=1,
-                 label=f'Order {order}' if order == 1 else f'Order {order}')
+    e_lines = e_ref * np.array([np.ones_like(_REFERENCE_ORDERS),
+                                (h_hi / h_lo) ** _REFERENCE_ORDERS])
+    ax.loglog([h_lo, h_hi], e_lines, 'k:', alpha=0.3, linewidth=1,
+             label=[f'Order {order:g}' for order in _REFERENCE_ORDERS])
 
     ax.set_xlabel('Grid Resolution h', fontweight='bold', fontsize=12)
     ax.set_ylabel('Error', fontweight='bold', fontsize=12)
     ax.set_title(title, fontweight='bold', fontsize=14)
-    ax.legend(loc='best', fontsize=9, ncol=2, frameon=True, shadow=True)
+    ax.legend(handles=handles + ax.get_lines(), loc='best', fontsize=9, ncol=2,
+              frameon=True, shadow=True)
     ax.grid(True, which='both', linestyle='--', alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats, bbox_inches='tight', close=owns_figure)
@@ -5,28 +5,51 @@ Error Plotting Module
 Visualization tools for error analysis.
 """
 
-import matplotlib.pyplot as plt
 import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
+matplotlib.use('Agg', force=False)  # Non-interactive backend
+import matplotlib.pyplot as plt
 import numpy as np
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-
-# Set publication-quality defaults
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 300
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titlesize'] = 14
-plt.rcParams['legend.fontsize'] = 10
-plt.rcParams['figure.figsize'] = (8, 6)
+from typing import List, Dict, Optional, Tuple, Sequence
+
+from ._io import save_figure
+from ._style import validation_style
+
+# Marker and color cycles shared by the multi-series plots
+_MARKERS = ('o', 's', '^', 'v', 'D', '*')
+_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b')
+
+# (percentile, error_stats key) pairs for the error distribution panel
+_PCT_KEYS = (
+    (0, 'min_error'),
+    (25, 'percentile_25'),
+    (50, 'median_abs_error'),
+    (75, 'percentile_75'),
+    (95, 'percentile_95'),
+    (99, 'percentile_99'),
+    (100, 'max_abs_error'),
+)
+_PERCENTILES = tuple(p for p, _ in _PCT_KEYS)
+
+
+@lru_cache(maxsize=64)
+def _reference_lines(h_min: float, h_max: float, e_ref: float):
+    """
+    Endpoints of the 1st and 2nd order reference lines through (h_min, e_ref),
+    as tuples so the cached values cannot be modified by callers.
+    """
+    ratio = h_max / h_min
+    return (h_min, h_max), (e_ref, e_ref * ratio), (e_ref, e_ref * ratio**2)
 
 
+@validation_style()
 def plot_error_vs_time(times: List[float],
                        errors: Dict[str, List[float]],
                        output_path: str,
                        title: str = "Error vs Time",
-                       log_scale: bool = True):
+                       log_scale: bool = True,
+                       formats: Sequence[str] = ('png', 'pdf')):
     """
     Plot error metrics vs time.
 
@@ -43,15 +66,14 @@ def plot_error_vs_time(times: List[float],
         Plot title
     log_scale : bool
         Use log scale for y-axis
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
     """
     fig, ax = plt.subplots(figsize=(10, 6))
 
-    markers = ['o', 's', '^', 'v', 'D', '*']
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b']
-
     for i, (error_type, error_values) in enumerate(errors.items()):
-        marker = markers[i % len(markers)]
-        color = colors[i % len(colors)]
+        marker = _MARKERS[i % len(_MARKERS)]
+        color = _COLORS[i % len(_COLORS)]
         ax.plot(times, error_values, marker=marker, label=error_type,
                 linewidth=2, markersize=6, color=color, alpha=0.8)
 
@@ -68,17 +90,16 @@ def plot_error_vs_time(times: List[float],
     plt.tight_layout()
 
     # Save as both PNG and PDF
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats)
 
 
+@validation_style()
 def plot_error_vs_resolution(resolutions: List[float],
                              errors: Dict[str, List[float]],
                              output_path: str,
                              title: str = "Error vs Grid Resolution",
-                             convergence_rates: Optional[Dict[str, float]] = None):
+                             convergence_rates: Optional[Dict[str, float]] = None,
+                             formats: Sequence[str] = ('png', 'pdf')):
     """
     Plot error vs grid resolution (convergence plot).
 
@@ -94,15 +115,14 @@ def plot_error_vs_resolution(resolutions: List[float],
         Plot title
     convergence_rates : dict, optional
         Convergence rates to display
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
     """
     fig, ax = plt.subplots(figsize=(10, 7))
 
-    markers = ['o', 's', '^', 'v', 'D', '*']
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b']
-
     for i, (error_type, error_values) in enumerate(errors.items()):
-        marker = markers[i % len(markers)]
-        color = colors[i % len(colors)]
+        marker = _MARKERS[i % len(_MARKERS)]
+        color = _COLORS[i % len(_COLORS)]
 
         label = error_type
         if convergence_rates and error_type in convergence_rates:
@@ -116,13 +136,12 @@ def plot_error_vs_resolution(resolutions: List[float],
     h_min, h_max = min(resolutions), max(resolutions)
     e_ref = errors[list(errors.keys())[0]][0]  # Reference error
 
+    h_ref, e_first, e_second = _reference_lines(h_min, h_max, e_ref)
+
     # First order reference
-    h_ref = np.array([h_min, h_max])
-    e_first = e_ref * (h_ref / h_min)
     ax.loglog(h_ref, e_first, 'k--', alpha=0.4, linewidth=1.5, label='1st order')
 
     # Second order reference
-    e_second = e_ref * (h_ref / h_min)**2
     ax.loglog(h_ref, e_second, 'k:', alpha=0.4, linewidth=1.5, label='2nd order')
 
     ax.set_xlabel('Grid Resolution h', fontweight='bold')
@@ -133,17 +152,16 @@ def plot_error_vs_resolution(resolutions: List[float],
 
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats)
 
 
+@validation_style()
 def plot_error_comparison(test_names: List[str],
                          errors: List[float],
                          output_path: str,
                          error_type: str = "L2",
-                         title: Optional[str] = None):
+                         title: Optional[str] = None,
+                         formats: Sequence[str] = ('png', 'pdf')):
     """
     Create bar chart comparing errors across multiple tests.
 
@@ -159,6 +177,8 @@ def plot_error_comparison(test_names: List[str],
         Type of error being plotted
     title : str, optional
         Plot title
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
     """
     fig, ax = plt.subplots(figsize=(12, 6))
 
@@ -188,15 +208,14 @@ def plot_error_comparison(test_names: List[str],
 
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats)
 
 
+@validation_style()
 def plot_error_statistics(error_stats: Dict[str, float],
                          output_path: str,
-                         title: str = "Error Statistics"):
+                         title: str = "Error Statistics",
+                         formats: Sequence[str] = ('png', 'pdf')):
     """
     Plot error statistics (mean, max, percentiles, etc.).
 
@@ -208,6 +227,8 @@ def plot_error_statistics(error_stats: Dict[str, float],
         Path to save figure
     title : str
         Plot title
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
     """
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
@@ -231,19 +252,10 @@ def plot_error_statistics(error_stats: Dict[str, float],
     ax1.grid(True, axis='y', linestyle='--', alpha=0.3)
 
     # Percentile distribution
-    percentiles = [0, 25, 50, 75, 95, 99, 100]
-    percentile_values = []
-
-    for p in percentiles:
-        key = f'percentile_{p:02d}' if p < 100 else 'max_abs_error'
-        if p == 0:
-            key = 'min_error'
-        if p == 50:
-            key = 'median_abs_error'
-
-        percentile_values.append(error_stats.get(key, 0))
+    percentile_values = np.fromiter((error_stats.get(key, 0) for _, key in _PCT_KEYS),
+                                    dtype=np.float64, count=len(_PCT_KEYS))
 
-    ax2.plot(percentiles, percentile_values, marker='o', linewidth=2,
+    ax2.plot(_PERCENTILES, percentile_values, marker='o', linewidth=2,
              markersize=8, color='steelblue', alpha=0.8)
     ax2.set_xlabel('Percentile', fontweight='bold')
     ax2.set_ylabel('Error Value', fontweight='bold')
@@ -251,19 +263,18 @@ def plot_error_statistics(error_stats: Dict[str, float],
     ax2.set_yscale('log')
     ax2.grid(True, linestyle='--', alpha=0.3)
 
-    plt.suptitle(title, fontweight='bold', fontsize=14, y=1.02)
+    plt.suptitle(title, fontweight='bold', fontsize=14)
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats)
 
 
+@validation_style()
 def plot_multi_error_timeline(times: List[float],
                               errors_dict: Dict[str, Dict[str, List[float]]],
                               output_path: str,
-                              title: str = "Error Evolution"):
+                              title: str = "Error Evolution",
+                              formats: Sequence[str] = ('png', 'pdf')):
     """
     Plot multiple error types for multiple tests on the same timeline.
 
@@ -277,8 +288,11 @@ def plot_multi_error_timeline(times: List[float],
         Path to save figure
     title : str
         Plot title
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
     """
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    # All panels share the time axis, so only the bottom row gets tick labels
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), sharex=True)
     axes = axes.flatten()
 
     error_types = ['L1', 'L2', 'Linf', 'RMS']
@@ -301,7 +315,4 @@ def plot_multi_error_timeline(times: List[float],
     plt.suptitle(title, fontweight='bold', fontsize=16, y=0.995)
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats)
@@ -5,18 +5,20 @@ Field Plotting Module
 Visualization tools for scalar field data.
 """
 
-import matplotlib.pyplot as plt
 import matplotlib
-matplotlib.use('Agg')
+matplotlib.use('Agg', force=False)
+import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Sequence
 import matplotlib.colors as mcolors
 
-plt.rcParams['figure.dpi'] = 150
-plt.rcParams['savefig.dpi'] = 300
+from ._display import MAX_DISPLAY_DIM, display_array, downsample, image_extent
+from ._io import save_figure
+from ._style import validation_style
 
 
+@validation_style()
 def plot_scalar_field_2d(field: np.ndarray,
                          output_path: str,
                          title: str = "Scalar Field",
@@ -25,7 +27,12 @@ def plot_scalar_field_2d(field: np.ndarray,
                          colorbar_label: str = "Value",
                          vmin: Optional[float] = None,
                          vmax: Optional[float] = None,
-                         cmap: str = 'viridis'):
+                         cmap: str = 'viridis',
+                         dtype=np.float32,
+                         interpolation: str = 'nearest',
+                         formats: Sequence[str] = ('png', 'pdf'),
+                         norm: Optional[mcolors.Normalize] = None,
+                         max_dim: Optional[int] = MAX_DISPLAY_DIM):
     """
     Plot 2D scalar field as colormap.
 
@@ -45,15 +52,27 @@ def plot_scalar_field_2d(field: np.ndarray,
         Color scale limits
     cmap : str
         Colormap name
+    dtype : np.dtype, optional
+        Precision the field is handed to imshow in (None keeps the field's)
+    interpolation : str
+        imshow interpolation; pass 'bilinear' for smoothed publication figures
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
+    norm : matplotlib.colors.Normalize, optional
+        Color normalization (e.g. LogNorm); replaces vmin/vmax
+    max_dim : int, optional
+        Fields longer than this along either axis are strided down before
+        drawing (None draws every cell)
     """
     if field.ndim != 2:
         raise ValueError(f"Field must be 2D, got {field.ndim}D")
 
     fig, ax = plt.subplots(figsize=(10, 8))
 
-    im = ax.imshow(field.T, origin='lower', aspect='auto',
-                   cmap=cmap, vmin=vmin, vmax=vmax,
-                   interpolation='bilinear')
+    im = ax.imshow(display_array(field, dtype, vmin, vmax, max_dim), origin='lower',
+                   extent=image_extent(field.shape),
+                   aspect='auto', cmap=cmap, vmin=vmin, vmax=vmax, norm=norm,
+                   interpolation=interpolation)
 
     ax.set_xlabel(xlabel, fontweight='bold')
     ax.set_ylabel(ylabel, fontweight='bold')
@@ -64,12 +83,10 @@ def plot_scalar_field_2d(field: np.ndarray,
 
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats)
 
 
+@validation_style()
 def plot_scalar_field_contour(field: np.ndarray,
                               output_path: str,
                               title: str = "Scalar Field Contours",
@@ -77,7 +94,10 @@ def plot_scalar_field_contour(field: np.ndarray,
                               ylabel: str = "Y",
                               num_levels: int = 20,
                               filled: bool = True,
-                              cmap: str = 'viridis'):
+                              cmap: str = 'viridis',
+                              formats: Sequence[str] = ('png', 'pdf'),
+                              max_dim: Optional[int] = MAX_DISPLAY_DIM,
+                              overlay_lines: bool = False):
     """
     Plot 2D scalar field as contours.
 
@@ -97,24 +117,36 @@ def plot_scalar_field_contour(field: np.ndarray,
         Use filled contours
     cmap : str
         Colormap name
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
+    max_dim : int, optional
+        Fields longer than this along either axis are strided down before
+        drawing (None draws every cell)
+    overlay_lines : bool
+        Draw faint contour lines over filled contours (a second contouring
+        pass over the field)
     """
     if field.ndim != 2:
         raise ValueError(f"Field must be 2D, got {field.ndim}D")
 
     fig, ax = plt.subplots(figsize=(10, 8))
 
-    ny, nx = field.shape
-    x = np.arange(nx)
-    y = np.arange(ny)
-    X, Y = np.meshgrid(x, y)
-
+    # Without X/Y, contour uses the same integer grid (column, row) that a
+    # meshgrid of the indices would give, without materializing it. A strided
+    # field gets the 1D index vectors of the rows and columns it kept.
+    data, stride = downsample(field, max_dim)
+    if stride > 1:
+        grid = (np.arange(data.shape[1]) * stride, np.arange(data.shape[0]) * stride, data)
+    else:
+        grid = (data,)
     if filled:
-        cs = ax.contourf(X, Y, field, levels=num_levels, cmap=cmap)
-        # Add contour lines
-        ax.contour(X, Y, field, levels=num_levels, colors='k',
-                  linewidths=0.5, alpha=0.3)
+        cs = ax.contourf(*grid, levels=num_levels, cmap=cmap)
+        if overlay_lines:
+            # Reuse the filled contours' levels rather than recomputing them
+            ax.contour(*grid, levels=cs.levels, colors='k',
+                      linewidths=0.5, alpha=0.3)
     else:
-        cs = ax.contour(X, Y, field, levels=num_levels, cmap=cmap)
+        cs = ax.contour(*grid, levels=num_levels, cmap=cmap)
         ax.clabel(cs, inline=True, fontsize=8)
 
     ax.set_xlabel(xlabel, fontweight='bold')
@@ -127,18 +159,18 @@ def plot_scalar_field_contour(field: np.ndarray,
 
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats)
 
 
+@validation_style()
 def plot_field_slice(field: np.ndarray,
                     output_path: str,
                     axis: int = 2,
                     slice_index: Optional[int] = None,
                     title: str = "Field Slice",
-                    cmap: str = 'viridis'):
+                    cmap: str = 'viridis',
+                    interpolation: str = 'nearest',
+                    formats: Sequence[str] = ('png', 'pdf')):
     """
     Plot slice of 3D field.
 
@@ -156,6 +188,10 @@ def plot_field_slice(field: np.ndarray,
         Plot title
     cmap : str
         Colormap name
+    interpolation : str
+        imshow interpolation (see plot_scalar_field_2d)
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
     """
     if field.ndim != 3:
         raise ValueError(f"Field must be 3D, got {field.ndim}D")
@@ -178,9 +214,11 @@ def plot_field_slice(field: np.ndarray,
 
     plot_scalar_field_2d(slice_data, output_path,
                         title=f"{title} (axis={axis}, index={slice_index})",
-                        xlabel=xlabel, ylabel=ylabel, cmap=cmap)
+                        xlabel=xlabel, ylabel=ylabel, cmap=cmap,
+                        interpolation=interpolation, formats=formats)
 
 
+@validation_style()
 def plot_field_difference(field1: np.ndarray,
                          field2: np.ndarray,
                          output_path: str,
@@ -188,7 +226,9 @@ def plot_field_difference(field1: np.ndarray,
                          xlabel: str = "X",
                          ylabel: str = "Y",
                          log_scale: bool = False,
-                         cmap: str = 'RdBu_r'):
+                         cmap: str = 'RdBu_r',
+                         interpolation: str = 'nearest',
+                         formats: Sequence[str] = ('png', 'pdf')):
     """
     Plot difference between two fields.
 
@@ -206,6 +246,10 @@ def plot_field_difference(field1: np.ndarray,
         Use log scale for difference
     cmap : str
         Colormap (diverging recommended)
+    interpolation : str
+        imshow interpolation (see plot_scalar_field_2d)
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
     """
     if field1.shape != field2.shape:
         raise ValueError("Fields must have same shape")
@@ -216,30 +260,46 @@ def plot_field_difference(field1: np.ndarray,
     diff = field1 - field2
 
     if log_scale:
-        diff_plot = np.log10(np.abs(diff) + 1e-14)
-        colorbar_label = "log₁₀|Difference|"
+        # The log is applied by LogNorm at draw time, not to the array
+        diff_plot = _abs_offset(diff, 1e-14)
+        colorbar_label = "|Difference|"
+        norm = mcolors.LogNorm()
+        vmin, vmax = None, None
     else:
         diff_plot = diff
         colorbar_label = "Difference"
-
-    # Make symmetric color scale for non-log
-    if not log_scale:
-        vmax = np.max(np.abs(diff))
+        norm = None
+        # Symmetric color scale; max|diff| from the two extrema, without an |diff| temporary
+        vmax = max(np.max(diff), -np.min(diff))
         vmin = -vmax
-    else:
-        vmin, vmax = None, None
 
     plot_scalar_field_2d(diff_plot, output_path, title=title,
                         xlabel=xlabel, ylabel=ylabel,
                         colorbar_label=colorbar_label,
-                        vmin=vmin, vmax=vmax, cmap=cmap)
+                        vmin=vmin, vmax=vmax, cmap=cmap,
+                        interpolation=interpolation, formats=formats,
+                        norm=norm)
+
+
+def _abs_offset(values: np.ndarray, offset: float) -> np.ndarray:
+    """|values| + offset, reusing the buffer of a float32/float64 input"""
+    if values.dtype in (np.float32, np.float64):
+        out = np.abs(values, out=values)
+    else:
+        # Narrower types (float16, small integers) would underflow the
+        # offset to 0, so they are promoted to float64 like np.abs(x) + offset
+        out = np.abs(values, dtype=np.float64)
+    out += offset
+    return out
 
 
+@validation_style()
 def plot_centerline_profile(field: np.ndarray,
                            output_path: str,
                            axis: int = 0,
                            title: str = "Centerline Profile",
-                           exact: Optional[np.ndarray] = None):
+                           exact: Optional[np.ndarray] = None,
+                           formats: Sequence[str] = ('png', 'pdf')):
     """
     Plot centerline profile of field.
 
@@ -255,6 +315,8 @@ def plot_centerline_profile(field: np.ndarray,
         Plot title
     exact : np.ndarray, optional
         Exact solution for comparison
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
     """
     # Extract centerline
     if field.ndim == 2:
@@ -291,7 +353,8 @@ def plot_centerline_profile(field: np.ndarray,
 
         # Also plot error
         ax2 = ax.twinx()
-        error = np.abs(profile - exact)
+        error = np.subtract(profile, exact)
+        np.abs(error, out=error)
         ax2.plot(x, error, 'g:', linewidth=1.5, label='|Error|', alpha=0.6)
         ax2.set_ylabel('Absolute Error', fontweight='bold', color='g')
         ax2.tick_params(axis='y', labelcolor='g')
@@ -305,17 +368,18 @@ def plot_centerline_profile(field: np.ndarray,
 
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats)
 
 
+@validation_style()
 def plot_field_heatmap(field: np.ndarray,
                       output_path: str,
                       title: str = "Field Heatmap",
                       cmap: str = 'hot',
-                      annotate: bool = False):
+                      annotate: bool = False,
+                      dtype=np.float32,
+                      formats: Sequence[str] = ('png', 'pdf'),
+                      max_dim: Optional[int] = MAX_DISPLAY_DIM):
     """
     Plot field as heatmap with optional annotations.
 
@@ -331,20 +395,28 @@ def plot_field_heatmap(field: np.ndarray,
         Colormap name
     annotate : bool
         Annotate cells with values
+    dtype : np.dtype, optional
+        Precision the field is handed to imshow in (None keeps the field's)
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
+    max_dim : int, optional
+        Fields longer than this along either axis are strided down before
+        drawing (None draws every cell)
     """
     if field.ndim != 2:
         raise ValueError(f"Field must be 2D, got {field.ndim}D")
 
     fig, ax = plt.subplots(figsize=(12, 10))
 
-    im = ax.imshow(field.T, origin='lower', aspect='auto',
+    im = ax.imshow(display_array(field, dtype, max_dim=max_dim), origin='lower',
+                   extent=image_extent(field.shape), aspect='auto',
                    cmap=cmap, interpolation='nearest')
 
     if annotate and field.size < 400:  # Only annotate for small grids
-        for i in range(field.shape[0]):
-            for j in range(field.shape[1]):
-                text = ax.text(i, j, f'{field[i, j]:.2e}',
-                             ha="center", va="center", color="w", fontsize=6)
+        # Format every label in one call, then place them in row-major order
+        labels = np.char.mod('%.2e', field).ravel()
+        for (i, j), label in zip(np.ndindex(field.shape), labels):
+            ax.text(i, j, label, ha="center", va="center", color="w", fontsize=6)
 
     ax.set_title(title, fontweight='bold', fontsize=14)
     cbar = plt.colorbar(im, ax=ax)
@@ -352,17 +424,19 @@ def plot_field_heatmap(field: np.ndarray,
 
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats)
 
 
+@validation_style()
 def plot_field_comparison_grid(fields: List[Tuple[np.ndarray, str]],
                                output_path: str,
                                title: str = "Field Comparison",
                                cmap: str = 'viridis',
-                               share_scale: bool = True):
+                               share_scale: bool = True,
+                               dtype=np.float32,
+                               interpolation: str = 'nearest',
+                               formats: Sequence[str] = ('png', 'pdf'),
+                               max_dim: Optional[int] = MAX_DISPLAY_DIM):
     """
     Plot multiple fields in a grid for comparison.
 
@@ -378,6 +452,15 @@ def plot_field_comparison_grid(fields: List[Tuple[np.ndarray, str]],
         Colormap name
     share_scale : bool
         Use same color scale for all fields
+    dtype : np.dtype, optional
+        Precision the fields are handed to imshow in (None keeps their own)
+    interpolation : str
+        imshow interpolation (see plot_scalar_field_2d)
+    formats : sequence of str
+        File formats to write (e.g. ('png',) to skip the PDF)
+    max_dim : int, optional
+        Fields longer than this along either axis are strided down before
+        drawing (None draws every cell)
     """
     n_fields = len(fields)
     ncols = min(3, n_fields)
@@ -390,14 +473,17 @@ def plot_field_comparison_grid(fields: List[Tuple[np.ndarray, str]],
     axes = axes.flatten()
 
     if share_scale:
-        vmin = min(np.min(f[0]) for f in fields)
-        vmax = max(np.max(f[0]) for f in fields)
+        # One (min, max) pair per field, reduced together
+        extrema = np.array([(np.min(f[0]), np.max(f[0])) for f in fields])
+        vmin = extrema[:, 0].min()
+        vmax = extrema[:, 1].max()
     else:
         vmin, vmax = None, None
 
     for i, (field, label) in enumerate(fields):
-        im = axes[i].imshow(field.T, origin='lower', aspect='auto',
-                          cmap=cmap, vmin=vmin, vmax=vmax, interpolation='bilinear')
+        im = axes[i].imshow(display_array(field, dtype, vmin, vmax, max_dim), origin='lower',
+                          extent=image_extent(field.shape), aspect='auto', cmap=cmap, vmin=vmin, vmax=vmax,
+                          interpolation=interpolation)
         axes[i].set_title(label, fontweight='bold')
         plt.colorbar(im, ax=axes[i])
 
@@ -408,7 +494,4 @@ def plot_field_comparison_grid(fields: List[Tuple[np.ndarray, str]],
     plt.suptitle(title, fontweight='bold', fontsize=16, y=0.995)
     plt.tight_layout()
 
-    output_path = Path(output_path)
-    plt.savefig(output_path.with_suffix('.png'), bbox_inches='tight')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight')
-    plt.close()
+    save_figure(fig, output_path, formats)
@@ -5,12 +5,133 @@ Report Generation Module
 Generates comprehensive validation reports in Markdown format.
 """
 
-import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 import os
 
+import numpy as np
+
+from ..json_io import read_json
+
+
+@lru_cache(maxsize=4096)
+def _load_json_cached(path: str, mtime_ns: int):
+    """Parse a JSON file; mtime_ns is part of the key so edited files are re-read"""
+    return read_json(path)
+
+
+# Reading the result files is I/O bound, so more threads than cores still help
+_LOAD_WORKERS = 16
+
+
+def _load_json(path: Path) -> Optional[Dict]:
+    """Load a JSON file through the cache, or None if it does not exist"""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load_json_cached(str(path), mtime_ns)
+
+
+def _load_test_result(test_dir: Path):
+    """Load one test directory's result and metrics as (test name, result dict)"""
+    # Copy the result, since the parsed dict is cached and is about to have
+    # the metrics attached
+    result_data = dict(_load_json(test_dir / 'test_result.json') or {})
+
+    metrics_data = _load_json(test_dir / 'metrics.json')
+    if metrics_data is not None:
+        result_data['metrics'] = metrics_data
+
+    return test_dir.name, result_data
+
+
+def _is_number(value) -> bool:
+    """Whether a metric value is numeric (and formatted as a number in the report)"""
+    return isinstance(value, (int, float))
+
+
+# Status markers in the results table
+_STATUS_EMOJI = {
+    'PASSED': '✅',
+    'FAILED': '❌',
+    'TIMEOUT': '⏱️',
+    'ERROR': '⚠️',
+    'NOT_BUILT': '🔨'
+}
+
+def _list_pngs(plots_dir: Path) -> List[str]:
+    """Sorted PNG file names in plots_dir (empty if the directory does not exist)"""
+    try:
+        with os.scandir(plots_dir) as it:
+            return sorted(e.name for e in it if e.name.endswith('.png'))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+# Relative mass error bounds (each exclusive) and the status for each bucket;
+# anything at or above the last bound, or NaN, is Poor
+_MASS_THRESHOLDS = np.array([1e-6, 1e-4, 1e-2])
+_MASS_STATUS = np.array(["✅ Excellent", "✅ Good", "⚠️ Acceptable", "❌ Poor"])
+
+# Lines of a failed test's error log quoted in the detailed results
+_ERROR_LOG_LINES = 20
+
+
+# Fixed appendix text, built once at import: the directory-tree entry written
+# for each test and the closing metric definitions (the report ends without a
+# trailing newline)
+_APPENDIX_TREE_ENTRY = (
+    "│   ├── {}/\n"
+    "│   │   ├── raw/\n"
+    "│   │   ├── plots/\n"
+    "│   │   ├── metrics.json\n"
+    "│   │   └── summary.md\n"
+)
+_APPENDIX_FOOTER = (
+    "└── Compatibility_Report.md\n"
+    "```\n"
+    "\n"
+    "### Metric Definitions\n"
+    "\n"
+    "- **L1 Error:** $L_1 = \\frac{\\int |u_{computed} - u_{exact}| dV}{\\int |u_{exact}| dV}$\n"
+    "- **L2 Error:** $L_2 = \\frac{\\sqrt{\\int (u_{computed} - u_{exact})^2 dV}}{\\sqrt{\\int u_{exact}^2 dV}}$\n"
+    "- **L∞ Error:** $L_\\infty = \\frac{\\max |u_{computed} - u_{exact}|}{\\max |u_{exact}|}$\n"
+    "- **Mass Error:** $\\frac{|M_{final} - M_{initial}|}{M_{initial}}$\n"
+    "- **Convergence Rate:** Slope of $\\log(error)$ vs $\\log(h)$\n"
+    "\n"
+    "---\n"
+    "\n"
+    "**End of Report**"
+)
+
+
+def _read_log_head(path: Path) -> Optional[List[str]]:
+    """First _ERROR_LOG_LINES lines of a log file, or None if it does not exist"""
+    # Open directly rather than exists() + open; stream only the first lines
+    # since crashed runs can leave huge logs
+    try:
+        with open(path, 'r', buffering=8192) as log:
+            return list(islice(log, _ERROR_LOG_LINES))
+    except FileNotFoundError:
+        return None
+
+
+def _numeric_column(values: List):
+    """
+    Float array of the numeric entries of values (NaN elsewhere) and the mask
+    of which entries were numeric.
+    """
+    present = np.fromiter((_is_number(v) for v in values), dtype=bool, count=len(values))
+    column = np.fromiter((v if ok else np.nan for v, ok in zip(values, present)),
+                         dtype=np.float64, count=len(values))
+    return column, present
+
 
 class CompatibilityReportGenerator:
     """Generates comprehensive compatibility validation reports"""
@@ -30,105 +151,173 @@ class CompatibilityReportGenerator:
         self.output_file = Path(output_file)
         self.test_results = {}
         self.summary_stats = {}
+        # Test names in report order, set by collect_results
+        self._sorted_names = None
 
-    def collect_results(self):
-        """Collect all test results from results directory"""
-        test_dirs = sorted([d for d in self.results_dir.iterdir() if d.is_dir() and d.name.startswith('Test')])
-
-        for test_dir in test_dirs:
-            test_name = test_dir.name
+    def collect_results(self, max_workers: Optional[int] = None):
+        """
+        Collect all test results from results directory.
 
-            # Load test result JSON
-            result_file = test_dir / 'test_result.json'
-            metrics_file = test_dir / 'metrics.json'
+        Parameters:
+        -----------
+        max_workers : int, optional
+            Number of threads reading test directories (default: up to 16)
+        """
+        # scandir entries answer is_dir() from the directory listing, without a stat per entry
+        with os.scandir(self.results_dir) as it:
+            test_dirs = sorted(Path(e.path) for e in it
+                               if e.name.startswith('Test') and e.is_dir())
 
-            result_data = {}
-            if result_file.exists():
-                with open(result_file, 'r') as f:
-                    result_data = json.load(f)
+        if len(test_dirs) <= 1 or max_workers == 1:
+            self.test_results.update(map(_load_test_result, test_dirs))
+        else:
+            # map keeps the sorted directory order
+            if max_workers is None:
+                max_workers = min(_LOAD_WORKERS, len(test_dirs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                self.test_results.update(executor.map(_load_test_result, test_dirs))
 
-            if metrics_file.exists():
-                with open(metrics_file, 'r') as f:
-                    metrics_data = json.load(f)
-                    result_data['metrics'] = metrics_data
+        self._sorted_names = sorted(self.test_results)
 
-            self.test_results[test_name] = result_data
+    def _precompute(self):
+        """
+        Walk the collected results once and keep the per-test fields the report
+        sections need as parallel lists/arrays, in sorted test order.
+        """
+        names = self._sorted_names
+        if names is None or len(names) != len(self.test_results):
+            # test_results was filled or changed without collect_results
+            names = self._sorted_names = sorted(self.test_results)
+        results = [self.test_results[name] for name in names]
+        metrics = [result.get('metrics', {}) for result in results]
+
+        # Plot links are made relative to the report's directory
+        self._report_dir = os.path.abspath(self.output_file.parent)
+
+        self._names = names
+        self._statuses = [result.get('status', 'UNKNOWN') for result in results]
+        self._durations = [result.get('duration', 0) for result in results]
+        self._metrics = metrics
+
+        self._l2, self._has_l2 = _numeric_column([m.get('L2') for m in metrics])
+        self._linf, self._has_linf = _numeric_column([m.get('Linf') for m in metrics])
+        self._mass_error, self._has_mass_error = _numeric_column(
+            [m.get('mass_error') for m in metrics])
+        self._conv_rate, self._has_conv_rate = _numeric_column(
+            [m.get('convergence_rate') for m in metrics])
+
+        # L2/L∞ in full precision appear in both the detailed results and the
+        # error rankings, so format each column once and share the strings
+        self._sci = {'L2': np.char.mod('%.6e', self._l2).tolist(),
+                     'Linf': np.char.mod('%.6e', self._linf).tolist()}
+
+        # Tests that report both masses
+        self._mass_idx = [i for i, m in enumerate(metrics)
+                          if 'initial_mass' in m and 'final_mass' in m]
+        self._m0 = np.array([metrics[i]['initial_mass'] for i in self._mass_idx], dtype=np.float64)
+        self._mf = np.array([metrics[i]['final_mass'] for i in self._mass_idx], dtype=np.float64)
+        # Relative mass error (absolute when the initial mass is zero), bucketed
+        # against the thresholds in one searchsorted call
+        with np.errstate(invalid='ignore'):
+            self._mass_rel = np.abs(self._mf - self._m0) / np.where(self._m0 != 0, self._m0, 1.0)
+        self._mass_status = _MASS_STATUS[
+            np.searchsorted(_MASS_THRESHOLDS, self._mass_rel, side='right')].tolist()
+
+    def _text_column(self, key: str, values: np.ndarray, present: np.ndarray,
+                     fmt: str) -> List[str]:
+        """
+        Table cells for one metric: the numeric entries formatted with fmt in
+        a single call, the rest as the metric's own text ('N/A' when missing).
+        """
+        column = np.char.mod(fmt, values).tolist()
+        for i in np.flatnonzero(~present):
+            column[i] = str(self._metrics[i].get(key, 'N/A'))
+        return column
 
     def generate_report(self):
         """Generate complete compatibility report"""
-        report_lines = []
-
-        # Header
-        report_lines.extend(self._generate_header())
+        self._precompute()
 
-        # Executive Summary
-        report_lines.extend(self._generate_executive_summary())
+        # Sections are streamed straight into one buffered file instead of
+        # being collected into a list of lines and joined at the end
+        with open(self.output_file, 'w', buffering=1 << 20) as f:
+            # Header
+            self._write_header(f)
 
-        # Test Results Table
-        report_lines.extend(self._generate_results_table())
+            # Executive Summary
+            self._write_executive_summary(f)
 
-        # Detailed Test Results
-        report_lines.extend(self._generate_detailed_results())
+            # Test Results Table
+            self._write_results_table(f)
 
-        # Error Analysis
-        report_lines.extend(self._generate_error_analysis())
+            # Detailed Test Results
+            self._write_detailed_results(f)
 
-        # Convergence Analysis
-        report_lines.extend(self._generate_convergence_analysis())
+            # Error Analysis
+            self._write_error_analysis(f)
 
-        # Mass Conservation Analysis
-        report_lines.extend(self._generate_mass_conservation_analysis())
+            # Convergence Analysis
+            self._write_convergence_analysis(f)
 
-        # Recommendations
-        report_lines.extend(self._generate_recommendations())
+            # Mass Conservation Analysis
+            self._write_mass_conservation_analysis(f)
 
-        # Appendix
-        report_lines.extend(self._generate_appendix())
+            # Recommendations
+            self._write_recommendations(f)
 
-        # Write report
-        with open(self.output_file, 'w') as f:
-            f.write('\n'.join(report_lines))
+            # Appendix
+            self._write_appendix(f)
 
         print(f"Report generated: {self.output_file}")
 
-    def _generate_header(self) -> List[str]:
-        """Generate report header"""
-        return [
-            "# IBAMR Scalar Transport Test Suite",
-            "## Compatibility Validation Report",
-            "",
-            f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            f"**IBAMR Version:** 0.18.0",
-            f"**Test Suite:** ScalarTransport_TestSuite_Standalone",
-            f"**Total Tests:** {len(self.test_results)}",
-            "",
-            "---",
-            ""
-        ]
-
-    def _generate_executive_summary(self) -> List[str]:
-        """Generate executive summary"""
-        total_tests = len(self.test_results)
-        passed = sum(1 for r in self.test_results.values() if r.get('status') == 'PASSED')
-        failed = sum(1 for r in self.test_results.values() if r.get('status') == 'FAILED')
+    def _write_header(self, f):
+        """Write report header"""
+        f.write(
+            "# IBAMR Scalar Transport Test Suite\n"
+            "## Compatibility Validation Report\n"
+            "\n"
+            f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            "\n"
+            f"**IBAMR Version:** 0.18.0\n"
+            f"**Test Suite:** ScalarTransport_TestSuite_Standalone\n"
+            f"**Total Tests:** {len(self._names)}\n"
+            "\n"
+            "---\n"
+            "\n"
+        )
+
+    def _write_executive_summary(self, f):
+        """Write executive summary"""
+        total_tests = len(self._names)
+        counts = Counter(self._statuses)
+        passed = counts['PASSED']
+        failed = counts['FAILED']
         errors = total_tests - passed - failed
 
-        lines = [
-            "## Executive Summary",
-            "",
+        f.write(
+            "## Executive Summary\n"
+            "\n"
             f"This report presents a comprehensive validation of the IBAMR 0.18.0 Scalar Transport "
             f"Test Suite. The validation includes quantitative error analysis, convergence studies, "
-            f"and mass conservation verification.",
-            "",
-            "### Overall Results",
-            "",
-            f"- **Total Tests:** {total_tests}",
-            f"- **Passed:** {passed} ({100*passed/total_tests:.1f}%)" if total_tests > 0 else "- **Passed:** 0 (0%)",
-            f"- **Failed:** {failed} ({100*failed/total_tests:.1f}%)" if total_tests > 0 else "- **Failed:** 0 (0%)",
-            f"- **Errors:** {errors} ({100*errors/total_tests:.1f}%)" if total_tests > 0 else "- **Errors:** 0 (0%)",
-            "",
-        ]
+            f"and mass conservation verification.\n"
+            "\n"
+            "### Overall Results\n"
+            "\n"
+            f"- **Total Tests:** {total_tests}\n"
+        )
+        if total_tests > 0:
+            f.write(
+                f"- **Passed:** {passed} ({100*passed/total_tests:.1f}%)\n"
+                f"- **Failed:** {failed} ({100*failed/total_tests:.1f}%)\n"
+                f"- **Errors:** {errors} ({100*errors/total_tests:.1f}%)\n"
+            )
+        else:
+            f.write(
+                "- **Passed:** 0 (0%)\n"
+                "- **Failed:** 0 (0%)\n"
+                "- **Errors:** 0 (0%)\n"
+            )
+        f.write("\n")
 
         # Overall assessment
         if failed == 0 and errors == 0:
@@ -138,315 +327,222 @@ class CompatibilityReportGenerator:
         else:
             assessment = "❌ **NEEDS ATTENTION** - Significant test failures detected."
 
-        lines.extend([
-            f"**Assessment:** {assessment}",
-            "",
-            "---",
-            ""
-        ])
-
-        return lines
-
-    def _generate_results_table(self) -> List[str]:
-        """Generate summary results table"""
-        lines = [
-            "## Test Results Summary",
-            "",
-            "| Test | Status | Duration | L2 Error | L∞ Error | Mass Error | Convergence Rate |",
-            "|------|--------|----------|----------|----------|------------|------------------|"
-        ]
-
-        for test_name in sorted(self.test_results.keys()):
-            result = self.test_results[test_name]
-            status = result.get('status', 'UNKNOWN')
-            duration = result.get('duration', 0)
-
-            # Get metrics if available
-            metrics = result.get('metrics', {})
-            l2_error = metrics.get('L2', 'N/A')
-            linf_error = metrics.get('Linf', 'N/A')
-            mass_error = metrics.get('mass_error', 'N/A')
-            conv_rate = metrics.get('convergence_rate', 'N/A')
-
-            # Format values
-            if isinstance(l2_error, (int, float)):
-                l2_str = f"{l2_error:.2e}"
-            else:
-                l2_str = str(l2_error)
-
-            if isinstance(linf_error, (int, float)):
-                linf_str = f"{linf_error:.2e}"
-            else:
-                linf_str = str(linf_error)
-
-            if isinstance(mass_error, (int, float)):
-                mass_str = f"{mass_error:.2e}"
-            else:
-                mass_str = str(mass_error)
-
-            if isinstance(conv_rate, (int, float)):
-                conv_str = f"{conv_rate:.2f}"
-            else:
-                conv_str = str(conv_rate)
-
-            # Status emoji
-            status_emoji = {
-                'PASSED': '✅',
-                'FAILED': '❌',
-                'TIMEOUT': '⏱️',
-                'ERROR': '⚠️',
-                'NOT_BUILT': '🔨'
-            }.get(status, '❓')
-
-            lines.append(
-                f"| {test_name} | {status_emoji} {status} | {duration:.1f}s | {l2_str} | {linf_str} | {mass_str} | {conv_str} |"
+        f.write(
+            f"**Assessment:** {assessment}\n"
+            "\n"
+            "---\n"
+            "\n"
+        )
+
+    def _write_results_table(self, f):
+        """Write summary results table"""
+        f.write(
+            "## Test Results Summary\n"
+            "\n"
+            "| Test | Status | Duration | L2 Error | L∞ Error | Mass Error | Convergence Rate |\n"
+            "|------|--------|----------|----------|----------|------------|------------------|\n"
+        )
+
+        l2_col = self._text_column('L2', self._l2, self._has_l2, '%.2e')
+        linf_col = self._text_column('Linf', self._linf, self._has_linf, '%.2e')
+        mass_col = self._text_column('mass_error', self._mass_error, self._has_mass_error, '%.2e')
+        conv_col = self._text_column('convergence_rate', self._conv_rate, self._has_conv_rate, '%.2f')
+
+        for row in zip(self._names, self._statuses, self._durations,
+                       l2_col, linf_col, mass_col, conv_col):
+            test_name, status, duration, l2_str, linf_str, mass_str, conv_str = row
+            status_emoji = _STATUS_EMOJI.get(status, '❓')
+            f.write(
+                f"| {test_name} | {status_emoji} {status} | {duration:.1f}s | {l2_str} | {linf_str} | {mass_str} | {conv_str} |\n"
             )
 
-        lines.extend(["", "---", ""])
-        return lines
-
-    def _generate_detailed_results(self) -> List[str]:
-        """Generate detailed results for each test"""
-        lines = [
-            "## Detailed Test Results",
-            ""
-        ]
+        f.write("\n---\n\n")
 
-        for test_name in sorted(self.test_results.keys()):
-            result = self.test_results[test_name]
-            metrics = result.get('metrics', {})
+    def _write_detailed_results(self, f):
+        """Write detailed results for each test"""
+        f.write(
+            "## Detailed Test Results\n"
+            "\n"
+        )
 
-            lines.extend([
-                f"### {test_name}",
-                ""
-            ])
+        for i, (test_name, status, metrics) in enumerate(
+                zip(self._names, self._statuses, self._metrics)):
+            f.write(f"### {test_name}\n\n")
 
             # Test info
-            status = result.get('status', 'UNKNOWN')
-            lines.append(f"**Status:** {status}")
+            f.write(f"**Status:** {status}\n")
 
             if status == 'PASSED':
-                lines.append("")
+                f.write("\n")
 
                 # Error metrics
                 if metrics:
-                    lines.append("#### Error Metrics")
-                    lines.append("")
+                    f.write("#### Error Metrics\n\n")
                     for metric, value in metrics.items():
                         if isinstance(value, (int, float)):
-                            lines.append(f"- **{metric}:** {value:.6e}")
+                            cached = self._sci.get(metric)
+                            text = cached[i] if cached is not None else f"{value:.6e}"
+                            f.write(f"- **{metric}:** {text}\n")
                         else:
-                            lines.append(f"- **{metric}:** {value}")
-                    lines.append("")
+                            f.write(f"- **{metric}:** {value}\n")
+                    f.write("\n")
 
                 # Plots
                 plots_dir = self.results_dir / test_name / 'plots'
-                if plots_dir.exists():
-                    plot_files = list(plots_dir.glob('*.png'))
-                    if plot_files:
-                        lines.append("#### Visualizations")
-                        lines.append("")
-                        for plot_file in sorted(plot_files):
-                            rel_path = os.path.relpath(plot_file, self.output_file.parent)
-                            plot_name = plot_file.stem.replace('_', ' ').title()
-                            lines.append(f"![{plot_name}]({rel_path})")
-                            lines.append("")
+                plot_files = _list_pngs(plots_dir)
+                if plot_files:
+                    f.write("#### Visualizations\n\n")
+                    # One relpath per test; the file names are appended to it
+                    rel_dir = os.path.relpath(plots_dir, self._report_dir)
+                    for plot_file in plot_files:
+                        rel_path = plot_file if rel_dir == '.' else os.path.join(rel_dir, plot_file)
+                        plot_name = os.path.splitext(plot_file)[0].replace('_', ' ').title()
+                        f.write(f"![{plot_name}]({rel_path})\n\n")
 
             elif status == 'FAILED':
-                lines.append("")
-                error_file = self.results_dir / test_name / 'test_error.log'
-                if error_file.exists():
-                    lines.append("**Error Log:**")
-                    lines.append("```")
-                    with open(error_file, 'r') as f:
-                        error_lines = f.readlines()[:20]  # First 20 lines
-                        lines.extend([line.rstrip() for line in error_lines])
-                    lines.append("```")
-                    lines.append("")
-
-            lines.append("---")
-            lines.append("")
-
-        return lines
-
-    def _generate_error_analysis(self) -> List[str]:
-        """Generate error analysis section"""
-        lines = [
-            "## Error Analysis",
-            "",
-            "This section analyzes error metrics across all tests.",
-            ""
-        ]
-
-        # Collect error metrics
-        l2_errors = []
-        linf_errors = []
-
-        for test_name, result in self.test_results.items():
-            metrics = result.get('metrics', {})
-            if 'L2' in metrics and isinstance(metrics['L2'], (int, float)):
-                l2_errors.append((test_name, metrics['L2']))
-            if 'Linf' in metrics and isinstance(metrics['Linf'], (int, float)):
-                linf_errors.append((test_name, metrics['Linf']))
-
-        if l2_errors:
-            lines.append("### L2 Error Rankings")
-            lines.append("")
-            lines.append("| Rank | Test | L2 Error |")
-            lines.append("|------|------|----------|")
-
-            sorted_l2 = sorted(l2_errors, key=lambda x: x[1])
-            for i, (test, error) in enumerate(sorted_l2, 1):
-                lines.append(f"| {i} | {test} | {error:.6e} |")
-
-            lines.append("")
-
-        if linf_errors:
-            lines.append("### L∞ Error Rankings")
-            lines.append("")
-            lines.append("| Rank | Test | L∞ Error |")
-            lines.append("|------|------|----------|")
-
-            sorted_linf = sorted(linf_errors, key=lambda x: x[1])
-            for i, (test, error) in enumerate(sorted_linf, 1):
-                lines.append(f"| {i} | {test} | {error:.6e} |")
-
-            lines.append("")
-
-        lines.extend(["---", ""])
-        return lines
-
-    def _generate_convergence_analysis(self) -> List[str]:
-        """Generate convergence analysis section"""
-        lines = [
-            "## Convergence Analysis",
-            "",
-            "Analysis of convergence rates for applicable tests.",
-            "",
-            "| Test | Convergence Rate | Expected | Status |",
-            "|------|------------------|----------|--------|"
-        ]
-
-        for test_name, result in sorted(self.test_results.items()):
-            metrics = result.get('metrics', {})
-            if 'convergence_rate' in metrics:
-                rate = metrics['convergence_rate']
-                expected = metrics.get('expected_order', 'N/A')
-
-                if isinstance(rate, (int, float)):
-                    if rate >= 1.8:
-                        status = "✅ 2nd order"
-                    elif rate >= 0.8:
-                        status = "✅ 1st order"
-                    elif rate >= 0.5:
-                        status = "⚠️ Sub-linear"
-                    else:
-                        status = "❌ Poor"
-
-                    lines.append(f"| {test_name} | {rate:.3f} | {expected} | {status} |")
-
-        lines.extend(["", "---", ""])
-        return lines
-
-    def _generate_mass_conservation_analysis(self) -> List[str]:
-        """Generate mass conservation analysis"""
-        lines = [
-            "## Mass Conservation Analysis",
-            "",
-            "Verification of mass conservation for all tests.",
-            "",
-            "| Test | Initial Mass | Final Mass | Relative Error | Status |",
-            "|------|--------------|------------|----------------|--------|"
-        ]
-
-        for test_name, result in sorted(self.test_results.items()):
-            metrics = result.get('metrics', {})
-            if 'initial_mass' in metrics and 'final_mass' in metrics:
-                M0 = metrics['initial_mass']
-                Mf = metrics['final_mass']
-                rel_error = abs(Mf - M0) / M0 if M0 != 0 else abs(Mf - M0)
-
-                if rel_error < 1e-6:
-                    status = "✅ Excellent"
-                elif rel_error < 1e-4:
-                    status = "✅ Good"
-                elif rel_error < 1e-2:
-                    status = "⚠️ Acceptable"
-                else:
-                    status = "❌ Poor"
-
-                lines.append(f"| {test_name} | {M0:.6e} | {Mf:.6e} | {rel_error:.6e} | {status} |")
-
-        lines.extend(["", "---", ""])
-        return lines
-
-    def _generate_recommendations(self) -> List[str]:
-        """Generate recommendations based on results"""
-        lines = [
-            "## Recommendations",
-            ""
-        ]
-
-        failed_tests = [name for name, result in self.test_results.items()
-                       if result.get('status') == 'FAILED']
+                f.write("\n")
+                error_lines = _read_log_head(self.results_dir / test_name / 'test_error.log')
+                if error_lines is not None:
+                    f.write("**Error Log:**\n```\n")
+                    for line in error_lines:
+                        f.write(line.rstrip() + "\n")
+                    f.write("```\n\n")
+
+            f.write("---\n\n")
+
+    def _write_error_analysis(self, f):
+        """Write error analysis section"""
+        f.write(
+            "## Error Analysis\n"
+            "\n"
+            "This section analyzes error metrics across all tests.\n"
+            "\n"
+        )
+
+        # Rank the tests that report each error (stable, so ties keep test order)
+        l2_idx = np.flatnonzero(self._has_l2)
+        l2_idx = l2_idx[np.argsort(self._l2[l2_idx], kind='stable')]
+        linf_idx = np.flatnonzero(self._has_linf)
+        linf_idx = linf_idx[np.argsort(self._linf[linf_idx], kind='stable')]
+
+        if l2_idx.size:
+            f.write(
+                "### L2 Error Rankings\n"
+                "\n"
+                "| Rank | Test | L2 Error |\n"
+                "|------|------|----------|\n"
+            )
+
+            for rank, i in enumerate(l2_idx, 1):
+                f.write(f"| {rank} | {self._names[i]} | {self._sci['L2'][i]} |\n")
+
+            f.write("\n")
+
+        if linf_idx.size:
+            f.write(
+                "### L∞ Error Rankings\n"
+                "\n"
+                "| Rank | Test | L∞ Error |\n"
+                "|------|------|----------|\n"
+            )
+
+            for rank, i in enumerate(linf_idx, 1):
+                f.write(f"| {rank} | {self._names[i]} | {self._sci['Linf'][i]} |\n")
+
+            f.write("\n")
+
+        f.write("---\n\n")
+
+    def _write_convergence_analysis(self, f):
+        """Write convergence analysis section"""
+        f.write(
+            "## Convergence Analysis\n"
+            "\n"
+            "Analysis of convergence rates for applicable tests.\n"
+            "\n"
+            "| Test | Convergence Rate | Expected | Status |\n"
+            "|------|------------------|----------|--------|\n"
+        )
+
+        for i in np.flatnonzero(self._has_conv_rate):
+            rate = self._conv_rate[i]
+            expected = self._metrics[i].get('expected_order', 'N/A')
+
+            if rate >= 1.8:
+                status = "✅ 2nd order"
+            elif rate >= 0.8:
+                status = "✅ 1st order"
+            elif rate >= 0.5:
+                status = "⚠️ Sub-linear"
+            else:
+                status = "❌ Poor"
+
+            f.write(f"| {self._names[i]} | {rate:.3f} | {expected} | {status} |\n")
+
+        f.write("\n---\n\n")
+
+    def _write_mass_conservation_analysis(self, f):
+        """Write mass conservation analysis"""
+        f.write(
+            "## Mass Conservation Analysis\n"
+            "\n"
+            "Verification of mass conservation for all tests.\n"
+            "\n"
+            "| Test | Initial Mass | Final Mass | Relative Error | Status |\n"
+            "|------|--------------|------------|----------------|--------|\n"
+        )
+
+        for i, M0, Mf, rel_error, status in zip(self._mass_idx, self._m0, self._mf,
+                                                self._mass_rel, self._mass_status):
+            f.write(f"| {self._names[i]} | {M0:.6e} | {Mf:.6e} | {rel_error:.6e} | {status} |\n")
+
+        f.write("\n---\n\n")
+
+    def _write_recommendations(self, f):
+        """Write recommendations based on results"""
+        f.write(
+            "## Recommendations\n"
+            "\n"
+        )
+
+        failed_tests = [name for name, status in zip(self._names, self._statuses)
+                        if status == 'FAILED']
 
         if not failed_tests:
-            lines.append("✅ All tests passed successfully. No immediate action required.")
+            f.write("✅ All tests passed successfully. No immediate action required.\n")
         else:
-            lines.append("### Failed Tests")
-            lines.append("")
-            lines.append("The following tests failed and require investigation:")
-            lines.append("")
-            for test in failed_tests:
-                lines.append(f"- **{test}**")
-            lines.append("")
-
-        lines.extend(["---", ""])
-        return lines
-
-    def _generate_appendix(self) -> List[str]:
-        """Generate appendix with additional information"""
-        lines = [
-            "## Appendix",
-            "",
-            "### Test Suite Structure",
-            "",
-            "```",
-            "ScalarTransport_TestSuite_Standalone/",
-            "├── results/",
-        ]
-
-        for test_name in sorted(self.test_results.keys()):
-            lines.extend([
-                f"│   ├── {test_name}/",
-                "│   │   ├── raw/",
-                "│   │   ├── plots/",
-                "│   │   ├── metrics.json",
-                "│   │   └── summary.md",
-            ])
-
-        lines.extend([
-            "└── Compatibility_Report.md",
-            "```",
-            "",
-            "### Metric Definitions",
-            "",
-            "- **L1 Error:** $L_1 = \\frac{\\int |u_{computed} - u_{exact}| dV}{\\int |u_{exact}| dV}$",
-            "- **L2 Error:** $L_2 = \\frac{\\sqrt{\\int (u_{computed} - u_{exact})^2 dV}}{\\sqrt{\\int u_{exact}^2 dV}}$",
-            "- **L∞ Error:** $L_\\infty = \\frac{\\max |u_{computed} - u_{exact}|}{\\max |u_{exact}|}$",
-            "- **Mass Error:** $\\frac{|M_{final} - M_{initial}|}{M_{initial}}$",
-            "- **Convergence Rate:** Slope of $\\log(error)$ vs $\\log(h)$",
-            "",
-            "---",
-            "",
-            "**End of Report**"
-        ])
-
-        return lines
+            f.write(
+                "### Failed Tests\n"
+                "\n"
+                "The following tests failed and require investigation:\n"
+                "\n"
+            )
+            f.writelines(f"- **{test}**\n" for test in failed_tests)
+            f.write("\n")
+
+        f.write("---\n\n")
+
+    def _write_appendix(self, f):
+        """Write appendix with additional information"""
+        f.write(
+            "## Appendix\n"
+            "\n"
+            "### Test Suite Structure\n"
+            "\n"
+            "```\n"
+            "ScalarTransport_TestSuite_Standalone/\n"
+            "├── results/\n"
+        )
+
+        f.writelines(map(_APPENDIX_TREE_ENTRY.format, self._names))
+        f.write(_APPENDIX_FOOTER)
 
 
 def generate_compatibility_report(results_dir: str,
-                                  output_file: str = "Compatibility_Report.md"):
+                                  output_file: str = "Compatibility_Report.md",
+                                  plot_jobs: Optional[List] = None,
+                                  max_workers: Optional[int] = None,
+                                  vector_output: bool = False):
     """
     Generate compatibility validation report.
 
@@ -456,7 +552,24 @@ def generate_compatibility_report(results_dir: str,
         Path to results directory
     output_file : str
         Output markdown file path
+    plot_jobs : list of (function, args, kwargs) tuples, optional
+        Plots to render before the report is written, so that they are
+        picked up from the tests' plots/ directories. They are independent,
+        so they are generated in parallel worker processes.
+    max_workers : int, optional
+        Number of worker processes for plot_jobs (default: cpu_count)
+    vector_output : bool
+        Also write the PDFs of plot_jobs. The report only embeds PNGs, so by
+        default jobs that do not choose their own formats write PNG only.
     """
+    if plot_jobs:
+        # Imported here so plain report generation does not load matplotlib
+        from ..plotting.batch import generate_plots
+        if not vector_output:
+            plot_jobs = [(fn, args, {'formats': ('png',), **kwargs})
+                         for fn, args, kwargs in plot_jobs]
+        generate_plots(plot_jobs, max_workers=max_workers)
+
     generator = CompatibilityReportGenerator(results_dir, output_file)
     generator.collect_results()
     generator.generate_report()